@@ -3,17 +3,22 @@
 
 """Browser module."""
 
+import asyncio
+import json
 import logging
 from subprocess import Popen
 from types import SimpleNamespace
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List
+from typing import Optional, Union
 
 from pyee import EventEmitter
 
 from pyppeteer.connection import Connection
 from pyppeteer.errors import BrowserError
+from pyppeteer.helper import debugError
 from pyppeteer.page import Page
 from pyppeteer.target import Target
+from pyppeteer.util import merge_dict
 
 logger = logging.getLogger(__name__)
 
@@ -201,6 +206,137 @@ class Browser(EventEmitter):
         """Make new page on this browser and return its object."""
         return await self._defaultContext.newPage()
 
+    async def crawl(self, urls: Iterable[str],  # noqa: C901
+                    handler: Callable[[Page, Any], Awaitable[Any]] = None,
+                    options: Dict = None, **kwargs: Any
+                    ) -> AsyncIterator[Dict[str, Any]]:
+        """Load ``urls`` in a pool of pages and yield a result for each.
+
+        :arg urls: URLs to load. Consumed lazily, so it can be a generator.
+        :arg handler: Optional coroutine function called with the page and the
+                      :class:`~pyppeteer.network_manager.Response` of each
+                      loaded URL. Its return value is yielded as ``result``.
+
+        This is an async generator which yields dictionaries with ``url``,
+        ``status``, ``result``, ``error`` (the exception of the last attempt,
+        or ``None``) and ``attempts``, in order of completion. Pages wait with
+        the next URL while results are not consumed.
+
+        Available options are:
+
+        * ``concurrency`` (int): Number of pages loading at the same time,
+          defaults to 4.
+        * ``retries`` (int): How many times a failed URL is tried again,
+          defaults to 1.
+        * ``timeout`` (int): Maximum time in milliseconds for navigation and
+          for the handler, each, defaults to 30 seconds. Pass ``0`` to disable
+          timeout.
+        * ``waitUntil`` (str|dict|list): Passed to
+          :meth:`~pyppeteer.page.Page.goto`, defaults to ``load``.
+        * ``recycleAfter`` (int): Number of navigations after which a page is
+          replaced by a new one, defaults to 50. Pages are also replaced after
+          any error.
+        * ``context`` (BrowserContext): Browser context to open pages in. By
+          default, a new incognito browser context is created and closed when
+          crawling is done.
+
+        .. code::
+
+            async def title(page, response):
+                return await page.title()
+
+            async for item in browser.crawl(urls, title, concurrency=8):
+                print(item['url'], item['result'] or item['error'])
+        """
+        options = merge_dict(options, kwargs)
+        concurrency = options.get('concurrency', 4)
+        retries = options.get('retries', 1)
+        timeout = options.get('timeout', 30000)
+        waitUntil = options.get('waitUntil', 'load')
+        recycleAfter = options.get('recycleAfter', 50)
+        context = options.get('context')
+        ownContext = context is None
+        if context is None:
+            context = await self.createIncognitoBrowserContext()
+
+        loop = self._connection._loop
+        urlIterator = iter(urls)
+        results: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+        finished = object()
+
+        async def closePage(page: Page) -> None:
+            try:
+                await page.close()
+            except Exception as e:
+                debugError(logger, e)
+
+        async def load(page: Page, url: str) -> Any:
+            response = await page.goto(url, timeout=timeout,
+                                       waitUntil=waitUntil)
+            result = None
+            if handler is not None:
+                result = await asyncio.wait_for(handler(page, response),
+                                                timeout / 1000 or None)
+            return response, result
+
+        async def worker() -> None:
+            page: Optional[Page] = None
+            navigations = 0
+            try:
+                for url in urlIterator:
+                    item: Dict[str, Any] = {
+                        'url': url, 'status': None, 'result': None,
+                        'error': None, 'attempts': 0,
+                    }
+                    while item['attempts'] <= retries:
+                        item['attempts'] += 1
+                        if page is not None and navigations >= recycleAfter:
+                            await closePage(page)
+                            page = None
+                        if page is None:
+                            page = await context.newPage()
+                            navigations = 0
+                        navigations += 1
+                        try:
+                            response, item['result'] = await load(page, url)
+                        except Exception as e:
+                            item['error'] = e
+                            await closePage(page)
+                            page = None
+                            continue
+                        item['error'] = None
+                        item['status'] = response.status if response else None
+                        break
+                    await results.put(item)
+            finally:
+                if page is not None:
+                    await closePage(page)
+
+        async def join(workers: List[asyncio.Task]) -> None:
+            try:
+                await asyncio.wait(workers)
+            finally:
+                await results.put(finished)
+
+        workers = [loop.create_task(worker()) for _ in range(concurrency)]
+        joiner = loop.create_task(join(workers))
+        try:
+            while True:
+                item = await results.get()
+                if item is finished:
+                    break
+                yield item
+            for task in workers:
+                if task.exception() is not None:
+                    raise task.exception()  # type: ignore
+        finally:
+            joiner.cancel()
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            if ownContext:
+                await context.close()
+
     async def _createPageInContext(self, contextId: Optional[str]) -> Page:
         options = {'url': 'about:blank'}
         if contextId:
@@ -308,6 +444,7 @@ class BrowserContext(EventEmitter):
         super().__init__()
         self._browser = browser
         self._id = contextId
+        self._sessionStorage: Dict[str, List[Dict[str, str]]] = {}
 
     def targets(self) -> List[Target]:
         """Return a list of all active targets inside the browser context."""
@@ -355,13 +492,194 @@ class BrowserContext(EventEmitter):
 
     async def newPage(self) -> Page:
         """Create a new page in the browser context."""
-        return await self._browser._createPageInContext(self._id)
+        page = await self._browser._createPageInContext(self._id)
+        if self._sessionStorage:
+            await page.evaluateOnNewDocument(restoreSessionStorage,
+                                             self._sessionStorage)
+        return page
 
     @property
     def browser(self) -> Browser:
         """Return the browser this browser context belongs to."""
         return self._browser
 
+    async def cookies(self) -> List[Dict[str, Union[str, int, bool]]]:
+        """Get all cookies of this browser context.
+
+        Unlike :meth:`pyppeteer.page.Page.cookies`, this returns cookies of
+        every URL and needs no open page. Cookies have the same fields as
+        returned by :meth:`pyppeteer.page.Page.cookies`.
+        """
+        resp = await self._browser._connection.send(
+            'Storage.getCookies', self._contextParams())
+        return resp.get('cookies', [])
+
+    async def setCookies(self, *cookies: Dict) -> None:
+        """Set cookies in this browser context with a single protocol call.
+
+        ``cookies`` have the same fields as for
+        :meth:`pyppeteer.page.Page.setCookie`, but each needs either ``url``
+        or ``domain``. Cookies returned by :meth:`cookies` can be passed as
+        they are.
+        """
+        if not cookies:
+            return
+        params = self._contextParams()
+        params['cookies'] = [_cookieParam(cookie) for cookie in cookies]
+        await self._browser._connection.send('Storage.setCookies', params)
+
+    async def clearCookies(self) -> None:
+        """Delete all cookies of this browser context."""
+        await self._browser._connection.send(
+            'Storage.clearCookies', self._contextParams())
+
+    async def snapshotCookies(self, path: str = None) -> List[Dict]:
+        """Take a snapshot of all cookies of this browser context.
+
+        The snapshot is a list of cookies which can be passed to
+        :meth:`restoreCookies`, e.g. of another browser context.
+
+        :arg str path: If given, also write the snapshot to this file as
+                       compact JSON.
+        """
+        snapshot = [_cookieParam(cookie) for cookie in await self.cookies()]
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, separators=(',', ':'))
+        return snapshot
+
+    async def restoreCookies(self, snapshot: Union[str, List[Dict]]) -> None:
+        """Replace all cookies of this browser context with a snapshot.
+
+        :arg snapshot: Snapshot returned by :meth:`snapshotCookies`, or path
+                       of a file written by it.
+
+        .. code::
+
+            snapshot = await loggedInContext.snapshotCookies('session.json')
+            context = await browser.createIncognitoBrowserContext()
+            await context.restoreCookies('session.json')
+        """
+        if isinstance(snapshot, str):
+            with open(snapshot, encoding='utf-8') as f:
+                snapshot = json.load(f)
+        await self.clearCookies()
+        await self.setCookies(*snapshot)
+
+    async def storageState(self, options: Dict = None, **kwargs: Any
+                           ) -> Dict[str, Any]:
+        """Take a snapshot of cookies and web storage of this context.
+
+        Returned dictionary can be passed to :meth:`restoreStorageState`, e.g.
+        of another browser context, and contains:
+
+        * ``cookies`` (List[Dict]): Cookies as by :meth:`snapshotCookies`.
+        * ``origins`` (List[Dict]): One item per origin with ``origin``,
+          ``localStorage`` and ``sessionStorage``, the latter two being lists
+          of ``name``/``value`` dictionaries.
+
+        Storage is read from every frame of the open pages of this context.
+
+        Available options are:
+
+        * ``path`` (str): If given, also write the state to this file as
+          JSON.
+        * ``origins`` (List[str]): Additional origins, e.g.
+          ``'https://example.com'``, to read ``localStorage`` from, even if no
+          page has them open.
+
+        IndexedDB and other storages are not included.
+        """
+        options = merge_dict(options, kwargs)
+        origins = await self._readOpenStorage()
+        missing = [origin for origin in options.get('origins', [])
+                   if origin not in origins]
+        if missing:
+            for storage in await self._evaluateOnOrigins(missing, readStorage):
+                storage['sessionStorage'] = []
+                origins[storage['origin']] = storage
+        state = {
+            'cookies': await self.snapshotCookies(),
+            'origins': list(origins.values()),
+        }
+        if options.get('path'):
+            with open(options['path'], 'w', encoding='utf-8') as f:
+                json.dump(state, f, separators=(',', ':'))
+        return state
+
+    async def restoreStorageState(self, state: Union[str, Dict[str, Any]]
+                                  ) -> None:
+        """Restore cookies and web storage taken by :meth:`storageState`.
+
+        :arg state: State returned by :meth:`storageState`, or path of a file
+                    written by it.
+
+        Cookies of this context are replaced by the cookies of the state.
+        ``localStorage`` is written right away, by loading every origin once
+        in a temporary page whose requests are answered with an empty
+        document without hitting the network. ``sessionStorage`` belongs to a
+        tab, so it is written into every page created by :meth:`newPage`
+        afterwards, before any script of the page runs, the first time the
+        page loads a document of each origin. Restoring another state replaces
+        the ``sessionStorage`` given to later pages.
+
+        .. code::
+
+            state = await loggedInContext.storageState(path='state.json')
+            context = await browser.createIncognitoBrowserContext()
+            await context.restoreStorageState('state.json')
+            page = await context.newPage()  # already logged in
+        """
+        self._sessionStorage = {}
+        if isinstance(state, str):
+            with open(state, encoding='utf-8') as f:
+                snapshot: Dict[str, Any] = json.load(f)
+        else:
+            snapshot = state
+        await self.restoreCookies(snapshot.get('cookies', []))
+        localStorage = {}
+        for storage in snapshot.get('origins', []):
+            if storage.get('localStorage'):
+                localStorage[storage['origin']] = storage['localStorage']
+            if storage.get('sessionStorage'):
+                self._sessionStorage[storage['origin']] = storage['sessionStorage']  # noqa: E501
+        if localStorage:
+            await self._evaluateOnOrigins(
+                list(localStorage), writeLocalStorage, localStorage)
+
+    async def _readOpenStorage(self) -> Dict[str, Dict]:
+        origins: Dict[str, Dict] = {}
+        for page in await self.pages():
+            for frame in page.frames:
+                try:
+                    storage = await frame.evaluate(readStorage)
+                except Exception as e:
+                    debugError(logger, e)
+                    continue
+                if storage['origin'] != 'null':
+                    origins.setdefault(storage['origin'], storage)
+        return origins
+
+    async def _evaluateOnOrigins(self, origins: List[str], pageFunction: str,
+                                 *args: Any) -> List[Any]:
+        page = await self._browser._createPageInContext(self._id)
+        try:
+            await page.setRequestInterception(True)
+            page.on('request', lambda request: asyncio.ensure_future(
+                request.respond({'contentType': 'text/html', 'body': ''})))
+            results = []
+            for origin in origins:
+                await page.goto(origin + '/')
+                results.append(await page.evaluate(pageFunction, *args))
+            return results
+        finally:
+            await page.close()
+
+    def _contextParams(self) -> Dict[str, Any]:
+        if self._id is None:
+            return {}
+        return {'browserContextId': self._id}
+
     async def close(self) -> None:
         """Close the browser context.
 
@@ -373,3 +691,45 @@ class BrowserContext(EventEmitter):
         if self._id is None:
             raise BrowserError('Non-incognito profile cannot be closed')
         await self._browser._disposeContext(self._id)
+
+
+# Read-only fields of cookies which ``Storage.setCookies`` does not accept.
+_cookieOutputFields = ('size', 'session')
+
+
+def _cookieParam(cookie: Dict) -> Dict:
+    param = {k: v for k, v in cookie.items() if k not in _cookieOutputFields}
+    if cookie.get('session') or param.get('expires', 0) < 0:
+        param.pop('expires', None)
+    return param
+
+
+readStorage = '''() => {
+    const items = storage => Object.keys(storage)
+        .filter(name => name !== '__pyppeteer_session_restored__')
+        .map(name => ({name, value: storage.getItem(name)}));
+    return {
+        origin: location.origin,
+        localStorage: items(localStorage),
+        sessionStorage: items(sessionStorage),
+    };
+}'''
+
+writeLocalStorage = '''origins => {
+    for (const {name, value} of origins[location.origin] || [])
+        localStorage.setItem(name, value);
+}'''
+
+# Runs on every new document of the page, but writes each origin's items only
+# once per tab, so items the page removes later are not brought back.
+restoreSessionStorage = '''origins => {
+    const items = origins[location.origin];
+    const marker = '__pyppeteer_session_restored__';
+    if (!items || sessionStorage.getItem(marker) !== null)
+        return;
+    sessionStorage.setItem(marker, '1');
+    for (const {name, value} of items) {
+        if (sessionStorage.getItem(name) === null)
+            sessionStorage.setItem(name, value);
+    }
+}'''
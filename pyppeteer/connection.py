@@ -6,7 +6,7 @@
 import asyncio
 import json
 import logging
-from typing import Awaitable, Callable, Dict, Union, TYPE_CHECKING
+from typing import Awaitable, Callable, Dict, List, Union, TYPE_CHECKING
 
 from pyee import EventEmitter
 import websockets
@@ -21,6 +21,10 @@ logger = logging.getLogger(__name__)
 logger_connection = logging.getLogger(__name__ + '.Connection')
 logger_session = logging.getLogger(__name__ + '.CDPSession')
 
+#: Pending fire-and-forget releases are flushed once per loop iteration, or
+#: as soon as this many are queued.
+RELEASE_BATCH_SIZE = 100
+
 
 class Connection(EventEmitter):
     """Connection management class."""
@@ -206,6 +210,8 @@ class CDPSession(EventEmitter):
         self._sessionId = sessionId
         self._sessions: Dict[str, CDPSession] = dict()
         self._loop = loop
+        self._pendingReleases: List[str] = []
+        self._releaseFlushScheduled = False
 
     def send(self, method: str, params: dict = None) -> Awaitable:
         """Send message to the connected session.
@@ -286,7 +292,31 @@ class CDPSession(EventEmitter):
         await self._connection.send('Target.detachFromTarget',
                                     {'sessionId': self._sessionId})
 
+    def _releaseObjectLater(self, objectId: str) -> None:
+        """Queue release of a remote object without waiting for it."""
+        self._pendingReleases.append(objectId)
+        if len(self._pendingReleases) >= RELEASE_BATCH_SIZE:
+            self._flushReleases()
+        elif not self._releaseFlushScheduled:
+            self._releaseFlushScheduled = True
+            self._loop.call_soon(self._flushReleases)
+
+    def _flushReleases(self) -> None:
+        self._releaseFlushScheduled = False
+        objectIds, self._pendingReleases = self._pendingReleases, []
+        if not self._connection:
+            return
+        for objectId in objectIds:
+            try:
+                self.send('Runtime.releaseObject', {'objectId': objectId}
+                          ).add_done_callback(_ignoreResult)  # type: ignore
+            except Exception as e:
+                # the target is gone, and its objects with it
+                logger_session.debug(e)
+                return
+
     def _on_closed(self) -> None:
+        self._pendingReleases.clear()
         for cb in self._callbacks.values():
             cb.set_exception(_rewriteError(
                 cb.error,  # type: ignore
@@ -301,6 +331,11 @@ class CDPSession(EventEmitter):
         return session
 
 
+def _ignoreResult(fut: asyncio.Future) -> None:
+    if not fut.cancelled() and fut.exception() is not None:
+        logger_session.debug(fut.exception())
+
+
 def _createProtocolError(error: Exception, method: str, obj: Dict
                          ) -> Exception:
     message = f'Protocol error ({method}): {obj["error"]["message"]}'
@@ -374,14 +374,7 @@ class ElementHandle(JSHandle):
             '(element, selector) => element.querySelectorAll(selector)',
             self, selector,
         )
-        properties = await arrayHandle.getProperties()
-        await arrayHandle.dispose()
-        result = []
-        for prop in properties.values():
-            elementHandle = prop.asElement()
-            if elementHandle:
-                result.append(elementHandle)
-        return result  # type: ignore
+        return await _arrayElements(arrayHandle)
 
     async def querySelectorEval(self, selector: str, pageFunction: str,
                                 *args: Any) -> Any:
@@ -447,7 +440,7 @@ class ElementHandle(JSHandle):
         )
         result = await self.executionContext.evaluate(
             pageFunction, arrayHandle, *args)
-        await arrayHandle.dispose()
+        arrayHandle._disposeInBackground()
         return result
 
     #: alias to :meth:`querySelector`
@@ -478,14 +471,7 @@ class ElementHandle(JSHandle):
                 return array;
 
             }''', self, expression)
-        properties = await arrayHandle.getProperties()
-        await arrayHandle.dispose()
-        result = []
-        for property in properties.values():
-            elementHandle = property.asElement()
-            if elementHandle:
-                result.append(elementHandle)
-        return result
+        return await _arrayElements(arrayHandle)
 
     #: alias to :meth:`xpath`
     Jx = xpath
@@ -504,6 +490,21 @@ class ElementHandle(JSHandle):
         }''', self)
 
 
+async def _arrayElements(arrayHandle: JSHandle) -> List[ElementHandle]:
+    # All items come back in one Runtime.getProperties call. The array itself
+    # is released without waiting, which saves a round trip per query.
+    properties = await arrayHandle.getProperties()
+    arrayHandle._disposeInBackground()
+    result = []
+    for prop in properties.values():
+        elementHandle = prop.asElement()
+        if elementHandle:
+            result.append(elementHandle)
+        else:
+            prop._disposeInBackground()
+    return result
+
+
 def _computeQuadArea(quad: List[Dict]) -> float:
     area = 0
     for i, _ in enumerate(quad):
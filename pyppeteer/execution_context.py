@@ -3,10 +3,13 @@
 
 """Execution Context Module."""
 
+import asyncio
+from contextvars import ContextVar
+import itertools
 import logging
 import math
 import re
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, TypeVar, TYPE_CHECKING
 
 from pyppeteer import helper
 from pyppeteer.connection import CDPSession
@@ -37,7 +40,9 @@ class ExecutionContext(object):
 
         auxData = contextPayload.get('auxData', {'isDefault': False})
         self._isDefault = bool(auxData.get('isDefault'))
+        self._worldName = contextPayload.get('name', '')
         self._objectHandleFactory = objectHandleFactory
+        self._cachedHandles: Dict[str, asyncio.Future] = dict()
 
     @property
     def frame(self) -> Optional['Frame']:
@@ -77,13 +82,14 @@ class ExecutionContext(object):
                     expressionWithSourceUrl = pageFunction
                 else:
                     expressionWithSourceUrl = f'{pageFunction}\n{suffix}'
-                _obj = await self._client.send('Runtime.evaluate', {
+                params = withObjectGroup(self._client, {
                     'expression': expressionWithSourceUrl,
                     'contextId': self._contextId,
                     'returnByValue': False,
                     'awaitPromise': True,
                     'userGesture': True,
                 })
+                _obj = await self._client.send('Runtime.evaluate', params)
             except Exception as e:
                 _rewriteError(e)
 
@@ -93,10 +99,11 @@ class ExecutionContext(object):
                     'Evaluation failed: {}'.format(
                         helper.getExceptionMessage(exceptionDetails)))
             remoteObject = _obj.get('result')
-            return self._objectHandleFactory(remoteObject)
+            return addToHandleScope(
+                self._objectHandleFactory(remoteObject), params)
 
         try:
-            _obj = await self._client.send('Runtime.callFunctionOn', {
+            params = withObjectGroup(self._client, {
                 'functionDeclaration': f'{pageFunction}\n{suffix}\n',
                 'executionContextId': self._contextId,
                 'arguments': [self._convertArgument(arg) for arg in args],
@@ -104,6 +111,7 @@ class ExecutionContext(object):
                 'awaitPromise': True,
                 'userGesture': True,
             })
+            _obj = await self._client.send('Runtime.callFunctionOn', params)
         except Exception as e:
             _rewriteError(e)
 
@@ -112,7 +120,41 @@ class ExecutionContext(object):
             raise ElementHandleError('Evaluation failed: {}'.format(
                 helper.getExceptionMessage(exceptionDetails)))
         remoteObject = _obj.get('result')
-        return self._objectHandleFactory(remoteObject)
+        return addToHandleScope(self._objectHandleFactory(remoteObject), params)
+
+    async def _cachedHandle(self, pageFunction: str) -> 'JSHandle':
+        """Get handle of ``pageFunction`` result, evaluated once per context.
+
+        Concurrent callers share a single evaluation. Used for the
+        ``document`` handle and for helper functions, which (with whatever
+        they cache in their closure) are then compiled once and later calls
+        only send a reference to them. The handle lives as long as this
+        context, do not dispose it.
+        """
+        future = self._cachedHandles.get(pageFunction)
+        if future is None:
+            # cached handles must outlive any handle scope
+            token = _currentHandleScope.set(None)
+            try:
+                future = self._client._loop.create_task(
+                    self.evaluateHandle(pageFunction))
+            finally:
+                _currentHandleScope.reset(token)
+            self._cachedHandles[pageFunction] = future
+
+            def _forget(fut: asyncio.Future) -> None:
+                if fut.cancelled() or fut.exception() is not None:
+                    if self._cachedHandles.get(pageFunction) is fut:
+                        del self._cachedHandles[pageFunction]
+
+            future.add_done_callback(_forget)
+        return await asyncio.shield(future)
+
+    def _onDestroyed(self) -> None:
+        # Remote objects die with the context, so only drop the references.
+        # Handles are not marked disposed: a caller racing the navigation
+        # then gets the protocol's context error, which WaitTask retries on.
+        self._cachedHandles.clear()
 
     def _convertArgument(self, arg: Any) -> Dict:  # noqa: C901
         if arg == math.inf:
@@ -142,10 +184,12 @@ class ExecutionContext(object):
         if not prototypeHandle._remoteObject.get('objectId'):
             raise ElementHandleError(
                 'Prototype JSHandle must not be referencing primitive value')
-        response = await self._client.send('Runtime.queryObjects', {
+        params = withObjectGroup(self._client, {
             'prototypeObjectId': prototypeHandle._remoteObject['objectId'],
         })
-        return self._objectHandleFactory(response.get('objects'))
+        response = await self._client.send('Runtime.queryObjects', params)
+        return addToHandleScope(
+            self._objectHandleFactory(response.get('objects')), params)
 
 
 class JSHandle(object):
@@ -161,6 +205,8 @@ class JSHandle(object):
         self._client = client
         self._remoteObject = remoteObject
         self._disposed = False
+        # object group of the handle scope owning the remote object, if any
+        self._objectGroup: Optional[str] = None
 
     @property
     def executionContext(self) -> ExecutionContext:
@@ -169,29 +215,59 @@ class JSHandle(object):
 
     async def getProperty(self, propertyName: str) -> 'JSHandle':
         """Get property value of ``propertyName``."""
-        objectHandle = await self._context.evaluateHandle(
-            '''(object, propertyName) => {
-                const result = {__proto__: null};
-                result[propertyName] = object[propertyName];
-                return result;
-            }''', self, propertyName)
-        properties = await objectHandle.getProperties()
-        result = properties[propertyName]
-        await objectHandle.dispose()
-        return result
+        # One call which returns the property itself. Promises are returned
+        # as they are, like properties read by getProperties().
+        try:
+            params = withObjectGroup(self._client, {
+                'functionDeclaration': '(object, propertyName) => object[propertyName]',  # noqa: E501
+                'executionContextId': self._context._contextId,
+                'arguments': [
+                    self._context._convertArgument(self),
+                    {'value': propertyName},
+                ],
+                'returnByValue': False,
+                'awaitPromise': False,
+            })
+            response = await self._client.send('Runtime.callFunctionOn', params)  # noqa: E501
+        except Exception as e:
+            _rewriteError(e)
+        exceptionDetails = response.get('exceptionDetails')
+        if exceptionDetails:
+            raise ElementHandleError('Evaluation failed: {}'.format(
+                helper.getExceptionMessage(exceptionDetails)))
+        return addToHandleScope(
+            self._context._objectHandleFactory(response.get('result')), params)
+
+    async def getProperties(self, names: List[str] = None
+                            ) -> Dict[str, 'JSHandle']:
+        """Get all properties of this handle.
 
-    async def getProperties(self) -> Dict[str, 'JSHandle']:
-        """Get all properties of this handle."""
+        :arg names: If given, get only these properties (enumerable or not)
+                    in two protocol calls, however many names there are.
+        """
+        if names is not None:
+            objectHandle = await self._context.evaluateHandle(
+                '''(object, names) => {
+                    const result = {__proto__: null};
+                    for (const name of names)
+                        result[name] = object[name];
+                    return result;
+                }''', self, list(names))
+            properties = await objectHandle.getProperties()
+            objectHandle._disposeInBackground()
+            return properties
         response = await self._client.send('Runtime.getProperties', {
             'objectId': self._remoteObject.get('objectId', ''),
             'ownProperties': True,
         })
         result = dict()
+        # properties are put into the object group of their owner
+        group = {'objectGroup': self._objectGroup}
         for prop in response['result']:
             if not prop.get('enumerable'):
                 continue
-            result[prop.get('name')] = self._context._objectHandleFactory(
-                prop.get('value'))
+            result[prop.get('name')] = addToHandleScope(
+                self._context._objectHandleFactory(prop.get('value')), group)
         return result
 
     async def jsonValue(self) -> Dict:
@@ -221,6 +297,16 @@ class JSHandle(object):
         except Exception as e:
             debugError(logger, e)
 
+    def _disposeInBackground(self) -> None:
+        # Like dispose(), but queues the release on the session, which sends
+        # pending releases in batches without a task per handle.
+        if self._disposed:
+            return
+        self._disposed = True
+        objectId = self._remoteObject.get('objectId')
+        if objectId:
+            self._client._releaseObjectLater(objectId)
+
     def toString(self) -> str:
         """Get string representation."""
         if self._remoteObject.get('objectId'):
@@ -231,6 +317,93 @@ class JSHandle(object):
             helper.valueFromRemoteObject(self._remoteObject))
 
 
+class HandleScope(object):
+    """Group of handles which are released together.
+
+    Use :meth:`pyppeteer.page.Page.handleScope` to create one.
+    """
+
+    _ids = itertools.count()
+
+    def __init__(self, client: CDPSession) -> None:
+        self._client = client
+        self.objectGroup = f'pyppeteer-handle-scope-{next(self._ids)}'
+        self._handles: List[JSHandle] = []
+        self._token: Any = None
+        self._released = False
+
+    async def __aenter__(self) -> 'HandleScope':
+        self._token = _currentHandleScope.set(self)
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        _currentHandleScope.reset(self._token)
+        self._released = True
+        await self.release()
+
+    async def release(self) -> None:
+        """Release all handles created in this scope so far.
+
+        Only handles whose remote object was put into this scope's object
+        group are released, i.e. results of evaluations, property reads,
+        object queries and element adoptions sent on the page's own session,
+        and properties listed by :meth:`JSHandle.getProperties` of such
+        handles. Other handles, such as properties of handles created before
+        the scope or console message arguments, keep their own lifetime.
+        """
+        for handle in self._handles:
+            handle._disposed = True
+        self._handles.clear()
+        try:
+            await self._client.send('Runtime.releaseObjectGroup', {
+                'objectGroup': self.objectGroup,
+            })
+        except Exception as e:
+            debugError(logger, e)
+
+
+_currentHandleScope: ContextVar[Optional[HandleScope]] = ContextVar(
+    'pyppeteer_handle_scope', default=None)
+
+
+def withObjectGroup(client: CDPSession, params: Dict) -> Dict:
+    """Add the object group of the current handle scope to ``params``.
+
+    Only calls sent on the session of the scope are grouped, as object groups
+    are released per session. Tasks which outlive the scope no longer group
+    their calls.
+    """
+    scope = _currentHandleScope.get()
+    if (scope is not None and not scope._released and
+            scope._client is client):
+        params['objectGroup'] = scope.objectGroup
+    return params
+
+
+_Handle = TypeVar('_Handle', bound=JSHandle)
+
+
+def addToHandleScope(handle: _Handle, params: Dict) -> _Handle:
+    """Register ``handle`` with the current handle scope.
+
+    ``params`` are the parameters of the call which created the handle. The
+    handle is registered only if they were grouped by :func:`withObjectGroup`,
+    so that releasing the scope never marks a handle disposed whose remote
+    object stays alive. A handle whose call was grouped but which arrives
+    after the scope exited is disposed right away, as its group is gone.
+    """
+    scope = _currentHandleScope.get()
+    if (scope is not None and
+            params.get('objectGroup') == scope.objectGroup and
+            handle._remoteObject.get('objectId')):
+        handle._objectGroup = scope.objectGroup
+        if scope._released:
+            handle._disposed = True
+        else:
+            scope._handles.append(handle)
+    return handle
+
+
 def _rewriteError(error: Exception) -> None:
     if error.args[0].endswith('Cannot find context with specified id'):
         msg = 'Execution context was destroyed, most likely because of a navigation.'  # noqa: E501
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Expiring map module."""
+
+from collections import OrderedDict
+import time
+from typing import Any, Callable, List, Tuple
+
+
+class ExpiringMap(object):
+    """Insertion ordered map which evicts its oldest entries.
+
+    Entries are evicted once there are more than ``maxSize`` of them or once
+    they are older than ``maxAge`` seconds. ``0`` disables either limit.
+    """
+
+    def __init__(self, maxSize: int = 0, maxAge: float = 0,
+                 timer: Callable[[], float] = time.monotonic) -> None:
+        """Make new expiring map."""
+        self._map: OrderedDict[Any, Tuple[float, Any]] = OrderedDict()
+        self._timer = timer
+        self.maxSize = maxSize
+        self.maxAge = maxAge
+        self.evictedBySize = 0
+        self.evictedByAge = 0
+
+    def set(self, key: Any, value: Any) -> List[Any]:
+        """Set value and return values evicted to make room for it."""
+        # re-inserting moves the entry to the end and refreshes its age
+        self._map.pop(key, None)
+        self._map[key] = (self._timer(), value)
+        return self.evict()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Get value."""
+        entry = self._map.get(key)
+        if entry is None:
+            return default
+        return entry[1]
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        """Remove key and return its value."""
+        entry = self._map.pop(key, None)
+        if entry is None:
+            return default
+        return entry[1]
+
+    def has(self, key: Any) -> bool:
+        """Check key is in this map."""
+        return key in self._map
+
+    def size(self) -> int:
+        """Length of this map."""
+        return len(self._map)
+
+    def values(self) -> List[Any]:
+        """Get all values as list."""
+        return [value for _, value in self._map.values()]
+
+    def evict(self) -> List[Any]:
+        """Evict entries exceeding the limits and return their values."""
+        evicted: List[Any] = []
+        if self.maxAge:
+            deadline = self._timer() - self.maxAge
+            while self._map:
+                timestamp, value = next(iter(self._map.values()))
+                if timestamp > deadline:
+                    break
+                self._map.popitem(last=False)
+                evicted.append(value)
+                self.evictedByAge += 1
+        if self.maxSize:
+            while len(self._map) > self.maxSize:
+                evicted.append(self._map.popitem(last=False)[1][1])
+                self.evictedBySize += 1
+        return evicted
+
+    def clear(self) -> None:
+        """Clear all entries of this map."""
+        self._map.clear()
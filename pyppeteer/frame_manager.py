@@ -7,7 +7,8 @@ import asyncio
 from collections import OrderedDict
 import logging
 from types import SimpleNamespace
-from typing import Any, Awaitable, Dict, Generator, List, Optional, Set, Union
+from typing import Any, AsyncIterator, Awaitable, Dict, Generator, List
+from typing import Optional, Set, Union
 
 from pyee import EventEmitter
 
@@ -15,12 +16,17 @@ from pyppeteer import helper
 from pyppeteer.connection import CDPSession
 from pyppeteer.element_handle import ElementHandle
 from pyppeteer.errors import NetworkError
+from pyppeteer.execution_context import EVALUATION_SCRIPT_URL
 from pyppeteer.execution_context import ExecutionContext, JSHandle
+from pyppeteer.execution_context import addToHandleScope, withObjectGroup
 from pyppeteer.errors import ElementHandleError, PageError, TimeoutError
+from pyppeteer.timers import scheduleDeadline
 from pyppeteer.util import merge_dict
 
 logger = logging.getLogger(__name__)
 
+UTILITY_WORLD_NAME = '__pyppeteer_utility_world__'
+
 
 class FrameManager(EventEmitter):
     """FrameManager class."""
@@ -41,6 +47,7 @@ class FrameManager(EventEmitter):
         self._frames: OrderedDict[str, Frame] = OrderedDict()
         self._mainFrame: Optional[Frame] = None
         self._contextIdToContext: Dict[str, ExecutionContext] = dict()
+        self._isolatedWorlds: Set[str] = set()
 
         client.on('Page.frameAttached',
                   lambda event: self._onFrameAttached(
@@ -71,6 +78,36 @@ class FrameManager(EventEmitter):
 
         self._handleFrameTree(frameTree)
 
+    async def _ensureIsolatedWorld(self, name: str) -> None:
+        """Create isolated world ``name`` in every current and new frame."""
+        if name in self._isolatedWorlds:
+            return
+        try:
+            await self._client.send('Page.addScriptToEvaluateOnNewDocument', {
+                'source': f'//# sourceURL={EVALUATION_SCRIPT_URL}',
+                'worldName': name,
+            })
+        except Exception as e:
+            # frames keep using their main world
+            helper.debugError(logger, e)
+            return
+        self._isolatedWorlds.add(name)
+        await asyncio.gather(*[
+            self._createIsolatedWorld(frame, name) for frame in self.frames()])
+
+    async def _createIsolatedWorld(self, frame: 'Frame', name: str) -> None:
+        try:
+            await self._client.send('Page.createIsolatedWorld', {
+                'frameId': frame._id,
+                'grantUniveralAccess': True,
+                'worldName': name,
+            })
+        except Exception as e:
+            helper.debugError(logger, e)
+            if (name == UTILITY_WORLD_NAME and
+                    not frame._utilityContextPromise.done()):
+                frame._setUtilityContext(None, failed=True)
+
     def _onLifecycleEvent(self, event: Dict) -> None:
         frame = self._frames.get(event['frameId'])
         if not frame:
@@ -115,7 +152,7 @@ class FrameManager(EventEmitter):
         if frameId in self._frames:
             return
         parentFrame = self._frames.get(parentFrameId)
-        frame = Frame(self._client, parentFrame, frameId)
+        frame = Frame(self._client, parentFrame, frameId, self)
         self._frames[frameId] = frame
         self.emit(FrameManager.Events.FrameAttached, frame)
 
@@ -143,7 +180,7 @@ class FrameManager(EventEmitter):
                 frame._id = _id
             else:
                 # Initial main frame navigation.
-                frame = Frame(self._client, None, _id)
+                frame = Frame(self._client, None, _id, self)
             self._frames[_id] = frame
             self._mainFrame = frame
 
@@ -193,6 +230,7 @@ class FrameManager(EventEmitter):
         if not context:
             return
         del self._contextIdToContext[executionContextId]
+        context._onDestroyed()
 
         frame = context.frame
         if frame:
@@ -200,6 +238,7 @@ class FrameManager(EventEmitter):
 
     def _onExecutionContextsCleared(self) -> None:
         for context in self._contextIdToContext.values():
+            context._onDestroyed()
             frame = context.frame
             if frame:
                 frame._removeExecutionContext(context)
@@ -239,45 +278,82 @@ class Frame(object):
     """
 
     def __init__(self, client: CDPSession, parentFrame: Optional['Frame'],
-                 frameId: str) -> None:
+                 frameId: str, frameManager: FrameManager = None) -> None:
         self._client = client
         self._parentFrame = parentFrame
         self._url = ''
         self._detached = False
         self._id = frameId
+        self._frameManager = frameManager
 
-        self._documentPromise: Optional[ElementHandle] = None
         self._contextResolveCallback = lambda _: None
         self._setDefaultContext(None)
+        self._utilityContextPromise: asyncio.Future = (
+            client._loop.create_future())
 
         self._waitTasks: Set[WaitTask] = set()  # maybe list
         self._loaderId = ''
         self._lifecycleEvents: Set[str] = set()
+        # Number of frames in this subtree (including itself) which have not
+        # fired each tracked lifecycle event yet, kept up to date on every
+        # lifecycle change so that checking a whole subtree is O(1).
+        self._missingLifecycle: Dict[str, int] = dict.fromkeys(
+            trackedLifecycleEvents, 1)
         self._childFrames: Set[Frame] = set()  # maybe list
         if self._parentFrame:
             self._parentFrame._childFrames.add(self)
+            for event in trackedLifecycleEvents:
+                self._parentFrame._updateMissingLifecycle(event, 1)
 
     def _addExecutionContext(self, context: ExecutionContext) -> None:
         if context._isDefault:
             self._setDefaultContext(context)
+        elif context._worldName == UTILITY_WORLD_NAME:
+            self._setUtilityContext(context)
 
     def _removeExecutionContext(self, context: ExecutionContext) -> None:
         if context._isDefault:
             self._setDefaultContext(None)
+        elif (self._utilityContextPromise.done() and
+                self._utilityContextPromise.result() is context):
+            self._setUtilityContext(None)
 
     def _setDefaultContext(self, context: Optional[ExecutionContext]) -> None:
         if context is not None:
             self._contextResolveCallback(context)  # type: ignore
             self._contextResolveCallback = lambda _: None
+            fallback = self._usesMainWorldAsUtility()
             for waitTask in self._waitTasks:
-                self._client._loop.create_task(waitTask.rerun())
+                if not waitTask._utilityWorld or fallback:
+                    self._client._loop.create_task(waitTask.rerun())
         else:
-            self._documentPromise = None
             self._contextPromise = self._client._loop.create_future()
             self._contextResolveCallback = (
                 lambda _context: self._contextPromise.set_result(_context)
             )
 
+    def _setUtilityContext(self, context: Optional[ExecutionContext],
+                           failed: bool = False) -> None:
+        # A utility context promise resolved to ``None`` means the world
+        # could not be created, and the main world is used instead.
+        if context is not None or failed:
+            loop = self._client._loop
+            if self._utilityContextPromise.done():
+                self._utilityContextPromise = loop.create_future()
+            self._utilityContextPromise.set_result(context)
+            for waitTask in self._waitTasks:
+                if waitTask._utilityWorld:
+                    self._client._loop.create_task(waitTask.rerun())
+        else:
+            self._utilityContextPromise = self._client._loop.create_future()
+
+    def _usesMainWorldAsUtility(self) -> bool:
+        if (self._frameManager is None or
+                UTILITY_WORLD_NAME not in self._frameManager._isolatedWorlds):
+            return True
+        return (self._utilityContextPromise.done() and
+                self._utilityContextPromise.result() is None)
+
     async def executionContext(self) -> Optional[ExecutionContext]:
         """Return execution context of this frame.
 
@@ -286,6 +362,37 @@ class Frame(object):
         """
         return await self._contextPromise
 
+    async def _utilityContext(self) -> Optional[ExecutionContext]:
+        # Isolated world for pyppeteer's own helpers, so that page scripts
+        # can neither break nor observe them. Falls back to the main world
+        # when the world was not set up for this frame's page or could not be
+        # created in this frame.
+        if not self._usesMainWorldAsUtility():
+            context = await self._utilityContextPromise
+            if context is not None:
+                return context
+        return await self.executionContext()
+
+    async def _adoptElementHandle(self, handle: ElementHandle
+                                  ) -> ElementHandle:
+        """Return handle of the same node in the main world."""
+        context = await self.executionContext()
+        if context is None:
+            raise PageError('No execution context.')
+        if handle.executionContext is context:
+            return handle
+        nodeInfo = await self._client.send('DOM.describeNode', {
+            'objectId': handle._remoteObject.get('objectId'),
+        })
+        params = withObjectGroup(self._client, {
+            'backendNodeId': nodeInfo['node']['backendNodeId'],
+            'executionContextId': context._contextId,
+        })
+        obj = await self._client.send('DOM.resolveNode', params)
+        await handle.dispose()
+        return addToHandleScope(
+            context._objectHandleFactory(obj['object']), params)
+
     async def evaluateHandle(self, pageFunction: str, *args: Any) -> JSHandle:
         """Execute function on this frame.
 
@@ -318,13 +425,10 @@ class Frame(object):
         return value
 
     async def _document(self) -> ElementHandle:
-        if self._documentPromise:
-            return self._documentPromise
         context = await self.executionContext()
         if context is None:
             raise PageError('No context exists.')
-        document = (await context.evaluateHandle('document')).asElement()
-        self._documentPromise = document
+        document = (await context._cachedHandle('document')).asElement()
         if document is None:
             raise PageError('Could not find `document`.')
         return document
@@ -381,7 +485,10 @@ class Frame(object):
 
     async def content(self) -> str:
         """Get the whole HTML contents of the page."""
-        return await self.evaluate('''
+        context = await self._utilityContext()
+        if context is None:
+            raise ElementHandleError('ExecutionContext is None.')
+        return await context.evaluate('''
 () => {
   let retVal = '';
   if (document.doctype)
@@ -617,8 +724,18 @@ function(html) {
                     'Values must be string. '
                     f'Found {value} of type {type(value)}'
                 )
-        return await self.querySelectorEval(  # type: ignore
-            selector, '''
+        context = await self._utilityContext()
+        if context is None:
+            raise ElementHandleError('ExecutionContext is None.')
+        handle = await context.evaluateHandle(
+            'selector => document.querySelector(selector)', selector)
+        element = handle.asElement()
+        if element is None:
+            await handle.dispose()
+            raise ElementHandleError(
+                f'Error: failed to find element matching selector "{selector}"'
+            )
+        result = await context.evaluate('''
 (element, values) => {
     if (element.nodeName.toLowerCase() !== 'select')
         throw new Error('Element is not a <select> element.');
@@ -635,7 +752,59 @@ function(html) {
     element.dispatchEvent(new Event('change', { 'bubbles': true }));
     return options.filter(option => option.selected).map(options => options.value)
 }
-        ''', values)  # noqa: E501
+        ''', element, values)  # noqa: E501
+        await element.dispose()
+        return result
+
+    async def extract(self, selector: str,
+                      fields: Union[Dict[str, str], List[str]]
+                      ) -> List[Dict[str, Any]]:
+        """Extract plain values from all elements matching ``selector``.
+
+        Details see :meth:`pyppeteer.page.Page.extract`.
+        """
+        context = await self._utilityContext()
+        if context is None:
+            raise ElementHandleError('ExecutionContext is None.')
+        return await context.evaluate(
+            f'(selector, fields) => ({extractFields})'
+            '(Array.from(document.querySelectorAll(selector)), fields)',
+            selector, _extractFields(fields),
+        )
+
+    async def extractIter(self, selector: str,
+                          fields: Union[Dict[str, str], List[str]],
+                          chunkSize: int = 1000
+                          ) -> AsyncIterator[Dict[str, Any]]:
+        """Extract plain values from matching elements chunk by chunk.
+
+        Details see :meth:`pyppeteer.page.Page.extractIter`.
+        """
+        if chunkSize <= 0:
+            raise ValueError(f'chunkSize must be positive: {chunkSize}')
+        context = await self._utilityContext()
+        if context is None:
+            raise ElementHandleError('ExecutionContext is None.')
+        _fields = _extractFields(fields)
+        arrayHandle = await context.evaluateHandle(
+            'selector => Array.from(document.querySelectorAll(selector))',
+            selector,
+        )
+        try:
+            start = 0
+            while True:
+                chunk = await context.evaluate(
+                    f'(elements, fields, start, end) => ({extractFields})'
+                    '(elements.slice(start, end), fields)',
+                    arrayHandle, _fields, start, start + chunkSize,
+                )
+                for item in chunk:
+                    yield item
+                if len(chunk) < chunkSize:
+                    break
+                start += chunkSize
+        finally:
+            await arrayHandle.dispose()
 
     async def tap(self, selector: str) -> None:
         """Tap the element which matches the ``selector``.
@@ -689,7 +858,7 @@ function(html) {
         return self.waitForSelector(selectorOrFunctionOrTimeout, options)
 
     def waitForSelector(self, selector: str, options: dict = None,
-                        **kwargs: Any) -> 'WaitTask':
+                        **kwargs: Any) -> Awaitable:
         """Wait until element which matches ``selector`` appears on page.
 
         Details see :meth:`pyppeteer.page.Page.waitForSelector`.
@@ -698,7 +867,7 @@ function(html) {
         return self._waitForSelectorOrXPath(selector, False, options)
 
     def waitForXPath(self, xpath: str, options: dict = None,
-                     **kwargs: Any) -> 'WaitTask':
+                     **kwargs: Any) -> Awaitable:
         """Wait until element which matches ``xpath`` appears on page.
 
         Details see :meth:`pyppeteer.page.Page.waitForXPath`.
@@ -720,7 +889,7 @@ function(html) {
 
     def _waitForSelectorOrXPath(self, selectorOrXPath: str, isXPath: bool,
                                 options: dict = None, **kwargs: Any
-                                ) -> 'WaitTask':
+                                ) -> Awaitable:
         options = merge_dict(options, kwargs)
         timeout = options.get('timeout', 30000)
         waitForVisible = bool(options.get('visible'))
@@ -755,7 +924,7 @@ function(html) {
 }
         '''  # noqa: E501
 
-        return WaitTask(
+        waitTask = WaitTask(
             self,
             predicate,
             title,
@@ -766,8 +935,18 @@ function(html) {
             isXPath,
             waitForVisible,
             waitForHidden,
+            utilityWorld=True,
         )
 
+        async def adoptResult() -> JSHandle:
+            handle = await waitTask
+            element = handle.asElement()
+            if element is None:
+                return handle
+            return await self._adoptElementHandle(element)
+
+        return self._client._loop.create_task(adoptResult())
+
     async def title(self) -> str:
         """Get title of the frame."""
         return await self.evaluate('() => document.title')
@@ -783,13 +962,44 @@ function(html) {
     def _onLifecycleEvent(self, loaderId: str, name: str) -> None:
         if name == 'init':
             self._loaderId = loaderId
+            for event in self._lifecycleEvents:
+                if event in self._missingLifecycle:
+                    self._updateMissingLifecycle(event, 1)
             self._lifecycleEvents.clear()
         else:
-            self._lifecycleEvents.add(name)
+            self._addLifecycleEvent(name)
 
     def _onLoadingStopped(self) -> None:
-        self._lifecycleEvents.add('DOMContentLoaded')
-        self._lifecycleEvents.add('load')
+        self._addLifecycleEvent('DOMContentLoaded')
+        self._addLifecycleEvent('load')
+
+    def _addLifecycleEvent(self, name: str) -> None:
+        if name in self._lifecycleEvents:
+            return
+        self._lifecycleEvents.add(name)
+        if name in self._missingLifecycle:
+            self._updateMissingLifecycle(name, -1)
+
+    def _updateMissingLifecycle(self, event: str, delta: int) -> None:
+        frame: Optional[Frame] = self
+        while frame is not None:
+            frame._missingLifecycle[event] += delta
+            frame = frame._parentFrame
+
+    def _hasSubtreeLifecycle(self, events: List[str]) -> bool:
+        """Check if this frame and all its descendants fired ``events``."""
+        for event in events:
+            missing = self._missingLifecycle.get(event)
+            if missing is None:
+                # Untracked event, fall back to walking the subtree.
+                if event not in self._lifecycleEvents:
+                    return False
+                for child in self._childFrames:
+                    if not child._hasSubtreeLifecycle([event]):
+                        return False
+            elif missing:
+                return False
+        return True
 
     def _detach(self) -> None:
         for waitTask in self._waitTasks:
@@ -798,9 +1008,40 @@ function(html) {
         self._detached = True
         if self._parentFrame:
             self._parentFrame._childFrames.remove(self)
+            for event, missing in self._missingLifecycle.items():
+                if missing:
+                    self._parentFrame._updateMissingLifecycle(
+                        event, -missing)
         self._parentFrame = None
 
 
+def _extractFields(fields: Union[Dict[str, str], List[str]]
+                   ) -> Dict[str, str]:
+    if isinstance(fields, dict):
+        return fields
+    return {field: field for field in fields}
+
+
+extractFields = """
+(elements, fields) => {
+  const entries = Object.entries(fields);
+  return elements.map(element => {
+    const item = {};
+    for (const [key, field] of entries) {
+      item[key] = field.startsWith('@')
+        ? element.getAttribute(field.slice(1))
+        : element[field];
+    }
+    return item;
+  });
+}
+""".strip()
+
+
+trackedLifecycleEvents = (
+    'DOMContentLoaded', 'load', 'networkAlmostIdle', 'networkIdle')
+
+
 class WaitTask(object):
     """WaitTask class.
 
@@ -809,7 +1050,8 @@ class WaitTask(object):
 
     def __init__(self, frame: Frame, predicateBody: str,  # noqa: C901
                  title: str, polling: Union[str, int], timeout: float,
-                 loop: asyncio.AbstractEventLoop, *args: Any) -> None:
+                 loop: asyncio.AbstractEventLoop, *args: Any,
+                 utilityWorld: bool = False) -> None:
         if isinstance(polling, str):
             if polling not in ['raf', 'mutation']:
                 raise ValueError(f'Unknown polling: {polling}')
@@ -830,25 +1072,29 @@ class WaitTask(object):
         else:
             self._predicateBody = f'return {predicateBody}'
         self._args = args
+        self._utilityWorld = utilityWorld
         self._runCount = 0
         self._terminated = False
         self._timeoutError = False
         frame._waitTasks.add(self)
 
         self.promise = self._loop.create_future()
+        # cancelling a task which awaits this one cancels the promise
+        self.promise.add_done_callback(
+            lambda fut: self._cleanup() if fut.cancelled() else None)
 
-        async def timer(timeout: Union[int, float]) -> None:
-            await asyncio.sleep(timeout / 1000)
+        def onTimeout() -> None:
             self._timeoutError = True
             self.terminate(TimeoutError(
                 f'Waiting for {title} failed: timeout {timeout}ms exceeds.'
             ))
 
         if timeout:
-            self._timeoutTimer = self._loop.create_task(timer(self._timeout))
+            self._timeoutTimer = scheduleDeadline(
+                self._loop, self._timeout, onTimeout)
         self._runningTask = self._loop.create_task(self.rerun())
 
-    def __await__(self) -> Generator:
+    def __await__(self) -> Generator[Any, None, Any]:
         """Make this class **awaitable**."""
         result = yield from self.promise
         if isinstance(result, Exception):
@@ -869,11 +1115,17 @@ class WaitTask(object):
         error = None
 
         try:
-            context = await self._frame.executionContext()
+            if self._utilityWorld:
+                context = await self._frame._utilityContext()
+            else:
+                context = await self._frame.executionContext()
             if context is None:
                 raise PageError('No execution context.')
+            waitForPredicate = await context._cachedHandle(
+                waitForPredicatePageFunction)
             success = await context.evaluateHandle(
-                waitForPredicatePageFunction,
+                '(waitForPredicate, ...args) => waitForPredicate(...args)',
+                waitForPredicate,
                 self._predicateBody,
                 self._polling,
                 self._timeout,
@@ -893,7 +1145,7 @@ class WaitTask(object):
         # Add try/except referring to puppeteer.
         try:
             if not error and success and (
-                    await self._frame.evaluate('s => !s', success)):
+                    await success.executionContext.evaluate('s => !s', success)):
                 await success.dispose()
                 return
         except NetworkError:
@@ -925,91 +1177,140 @@ class WaitTask(object):
         self._frame._waitTasks.remove(self)
 
 
+# Installed once per execution context by WaitTask, see
+# ExecutionContext._cachedHandle. The most recently used compiled predicates
+# are kept for later reruns.
 waitForPredicatePageFunction = """
-async function waitForPredicatePageFunction(predicateBody, polling, timeout, ...args) {
-  const predicate = new Function('...args', predicateBody);
-  let timedOut = false;
-  if (timeout)
-    setTimeout(() => timedOut = true, timeout);
-  if (polling === 'raf')
-    return await pollRaf();
-  if (polling === 'mutation')
-    return await pollMutation();
-  if (typeof polling === 'number')
-    return await pollInterval(polling);
-
-  /**
-   * @return {!Promise<*>}
-   */
-  function pollMutation() {
-    const success = predicate.apply(null, args);
-    if (success)
-      return Promise.resolve(success);
-
-    let fulfill;
-    const result = new Promise(x => fulfill = x);
-    const observer = new MutationObserver(mutations => {
-      if (timedOut) {
-        observer.disconnect();
-        fulfill();
-      }
-      const success = predicate.apply(null, args);
-      if (success) {
-        observer.disconnect();
-        fulfill(success);
-      }
-    });
-    observer.observe(document, {
-      childList: true,
-      subtree: true,
-      attributes: true
-    });
-    return result;
-  }
-
-  /**
-   * @return {!Promise<*>}
-   */
-  function pollRaf() {
-    let fulfill;
-    const result = new Promise(x => fulfill = x);
-    onRaf();
-    return result;
-
-    function onRaf() {
-      if (timedOut) {
-        fulfill();
-        return;
-      }
+() => {
+  const maxPredicates = 32;
+  const predicates = new Map();
+  return async function waitForPredicatePageFunction(predicateBody, polling, timeout, ...args) {
+    let predicate = predicates.get(predicateBody);
+    if (predicate) {
+      predicates.delete(predicateBody);
+    } else {
+      predicate = new Function('...args', predicateBody);
+      if (predicates.size >= maxPredicates)
+        predicates.delete(predicates.keys().next().value);
+    }
+    predicates.set(predicateBody, predicate);
+    let timedOut = false;
+    if (timeout)
+      setTimeout(() => timedOut = true, timeout);
+    if (polling === 'raf')
+      return await pollRaf();
+    if (polling === 'mutation')
+      return await pollMutation();
+    if (typeof polling === 'number')
+      return await pollInterval(polling);
+
+    /**
+     * @return {!Promise<*>}
+     */
+    function pollMutation() {
       const success = predicate.apply(null, args);
       if (success)
-        fulfill(success);
-      else
-        requestAnimationFrame(onRaf);
+        return Promise.resolve(success);
+
+      let fulfill, reject;
+      const result = new Promise((x, y) => { fulfill = x; reject = y; });
+      mutationWaits().add(() => {
+        if (timedOut) {
+          fulfill();
+          return true;
+        }
+        try {
+          const success = predicate.apply(null, args);
+          if (success)
+            fulfill(success);
+          return !!success;
+        } catch (e) {
+          reject(e);
+          return true;
+        }
+      });
+      return result;
+    }
+
+    /**
+     * All mutation waits of a document share one MutationObserver, which
+     * checks every pending wait once per batch of mutations and disconnects
+     * when none is left.
+     * @return {!{add: function(function():boolean)}}
+     */
+    function mutationWaits() {
+      const key = Symbol.for('pyppeteer.mutationWaits');
+      if (window[key])
+        return window[key];
+      const waits = new Set();
+      const observer = new MutationObserver(() => {
+        for (const check of Array.from(waits)) {
+          if (check())
+            waits.delete(check);
+        }
+        if (!waits.size)
+          observer.disconnect();
+      });
+      const registry = {
+        add(check) {
+          if (!waits.size) {
+            observer.observe(document, {
+              childList: true,
+              subtree: true,
+              attributes: true
+            });
+          }
+          waits.add(check);
+        }
+      };
+      Object.defineProperty(window, key, {value: registry});
+      return registry;
     }
-  }
-
-  /**
-   * @param {number} pollInterval
-   * @return {!Promise<*>}
-   */
-  function pollInterval(pollInterval) {
-    let fulfill;
-    const result = new Promise(x => fulfill = x);
-    onTimeout();
-    return result;
-
-    function onTimeout() {
-      if (timedOut) {
-        fulfill();
-        return;
+
+    /**
+     * @return {!Promise<*>}
+     */
+    function pollRaf() {
+      let fulfill;
+      const result = new Promise(x => fulfill = x);
+      onRaf();
+      return result;
+
+      function onRaf() {
+        if (timedOut) {
+          fulfill();
+          return;
+        }
+        const success = predicate.apply(null, args);
+        if (success)
+          fulfill(success);
+        else
+          requestAnimationFrame(onRaf);
+      }
+    }
+
+    /**
+     * @param {number} pollInterval
+     * @return {!Promise<*>}
+     */
+    function pollInterval(pollInterval) {
+      let fulfill;
+      const result = new Promise(x => fulfill = x);
+      onTimeout();
+      return result;
+
+      function onTimeout() {
+        if (timedOut) {
+          fulfill();
+          return;
+        }
+        const success = predicate.apply(null, args);
+        if (success)
+          fulfill(success);
+        else
+          setTimeout(onTimeout, pollInterval);
       }
-      const success = predicate.apply(null, args);
-      if (success)
-        fulfill(success);
-      else
-        setTimeout(onTimeout, pollInterval);
     }
-  }
+  };
 }
 """  # noqa: E501
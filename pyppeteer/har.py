@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""HAR (HTTP Archive) recording module."""
+
+import asyncio
+import base64
+from datetime import datetime, timezone
+import hashlib
+import json
+import logging
+from typing import Any, Callable, Dict, IO, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Union
+from urllib.parse import parse_qsl, urlsplit
+
+from pyppeteer import __version__, helper
+from pyppeteer.connection import CDPSession
+from pyppeteer.errors import PageError
+from pyppeteer.helper import debugError
+from pyppeteer.network_manager import Request, Response, headersArray
+from pyppeteer.network_manager import statusTexts, urlMatches
+from pyppeteer.util import merge_dict
+
+if TYPE_CHECKING:
+    from pyppeteer.network_manager import NetworkManager  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+# Recorded bodies are stored decoded, so these headers no longer apply.
+replayDroppedHeaders = (
+    'content-encoding',
+    'content-length',
+    'transfer-encoding',
+)
+
+textMimeTypes = (
+    'application/javascript',
+    'application/json',
+    'application/x-javascript',
+    'application/xml',
+    'image/svg+xml',
+)
+
+
+class HarRecorder(object):
+    """HarRecorder class.
+
+    HarRecorder writes the network traffic of a page to a
+    `HAR <http://www.softwareishard.com/blog/har-12-spec/>`_ file. Entries are
+    appended to the file as soon as their request finishes, so the recorded
+    log is never held in memory.
+
+    .. code::
+
+        await page.har.start({'path': 'page.har', 'content': 'embed'})
+        await page.goto('https://www.google.com')
+        await page.har.stop()
+    """
+
+    def __init__(self, client: CDPSession,
+                 networkManager: 'NetworkManager') -> None:
+        self._client = client
+        self._networkManager = networkManager
+        self._writer: Optional[HarWriter] = None
+        self._embedContent = False
+        self._contentFilter: List[Union[str, Callable[[Response], bool]]] = []  # noqa: E501
+        self._maxContentSize = 0
+        self._entries: Dict[Request, Dict] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._pages: List[Dict] = []
+        self._pageStartTime = 0.0
+        self._eventListeners: List[dict] = []
+
+    async def start(self, options: Dict = None, **kwargs: Any) -> None:
+        """Start recording.
+
+        This method accepts the following options:
+
+        * ``path`` (str): A path to write the HAR file to. Required.
+        * ``content`` (str): ``'omit'`` (default) or ``'embed'``. With
+          ``'embed'``, response bodies are stored in the HAR file.
+        * ``contentFilter`` (List[str|Callable[[Response], bool]]): Only
+          embed bodies of responses matching any of these URL wildcard
+          patterns or predicates. Defaults to all responses.
+        * ``maxContentSize`` (int): Do not embed bodies of responses which
+          transferred more than this many bytes. ``0`` (default) means no
+          limit.
+        """
+        options = merge_dict(options, kwargs)
+        if self._writer is not None:
+            raise PageError('HAR recording is already started.')
+        path = options.get('path')
+        if not path:
+            raise PageError('HAR recording needs a path.')
+        content = options.get('content', 'omit')
+        if content not in ('omit', 'embed'):
+            raise PageError(f'Unknown content option: {content}')
+        self._embedContent = content == 'embed'
+        self._contentFilter = list(options.get('contentFilter', []))
+        self._maxContentSize = options.get('maxContentSize', 0)
+        self._pages = []
+        self._writer = HarWriter(path)
+        self._eventListeners = [
+            helper.addEventListener(
+                self._client, 'Page.domContentEventFired',
+                lambda event: self._onPageTiming('onContentLoad', event)),
+            helper.addEventListener(
+                self._client, 'Page.loadEventFired',
+                lambda event: self._onPageTiming('onLoad', event)),
+        ]
+        self._networkManager._harRecorder = self
+
+    async def stop(self) -> None:
+        """Stop recording and finish the HAR file.
+
+        Requests which are still in flight are not recorded.
+        """
+        if self._writer is None:
+            raise PageError('HAR recording is not started.')
+        self._detach()
+        try:
+            if self._tasks:
+                await asyncio.gather(*self._tasks)
+        finally:
+            self._closeWriter()
+
+    def _close(self) -> None:
+        """Finish the HAR file when the page goes away while recording.
+
+        Entries still waiting for their response bodies are dropped.
+        """
+        if self._writer is None:
+            return
+        self._detach()
+        for task in self._tasks:
+            task.cancel()
+        self._closeWriter()
+
+    def _detach(self) -> None:
+        self._networkManager._harRecorder = None
+        helper.removeEventListeners(self._eventListeners)
+        self._entries.clear()
+
+    def _closeWriter(self) -> None:
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.close(self._pages)
+
+    def _onPageTiming(self, name: str, event: Dict) -> None:
+        if self._pages:
+            offset = (event.get('timestamp', 0) - self._pageStartTime) * 1000
+            self._pages[-1]['pageTimings'][name] = round(offset, 3)
+
+    def _onRequest(self, request: Request, event: Dict) -> None:
+        redirectResponse = event.get('redirectResponse')
+        if redirectResponse and request._redirectChain:
+            redirected = request._redirectChain[-1]
+            entry = self._entries.pop(redirected, None)
+            if entry is not None:
+                self._setResponse(entry, redirectResponse)
+                self._finishEntry(entry, event.get('timestamp', 0), 0)
+                self._writeEntry(entry)
+        elif (request.isNavigationRequest() and request.frame is not None and
+                request.frame.parentFrame is None):
+            self._pageStartTime = event.get('timestamp', 0)
+            self._pages.append({
+                'startedDateTime': _isoformat(event.get('wallTime', 0)),
+                'id': f'page_{len(self._pages) + 1}',
+                'title': request.url,
+                'pageTimings': {'onContentLoad': -1, 'onLoad': -1},
+            })
+
+        payload = event.get('request', {})
+        url = payload.get('url', request.url)
+        harRequest = {
+            'method': payload.get('method', ''),
+            'url': url,
+            'httpVersion': 'HTTP/1.1',
+            'cookies': [],
+            'headers': headersArray(payload.get('headers', {})),
+            'queryString': [
+                {'name': name, 'value': value} for name, value in
+                parse_qsl(urlsplit(url).query, keep_blank_values=True)
+            ],
+            'headersSize': -1,
+            'bodySize': 0,
+        }
+        postData = payload.get('postData')
+        if postData is not None:
+            harRequest['postData'] = {
+                'mimeType': request.headers.get('content-type', ''),
+                'text': postData,
+            }
+            harRequest['bodySize'] = len(postData.encode('utf-8'))
+        entry = {
+            'startedDateTime': _isoformat(event.get('wallTime', 0)),
+            'time': 0,
+            'request': harRequest,
+            'response': None,
+            'cache': {},
+            'timings': None,
+            '_requestTime': event.get('timestamp', 0),
+            '_resourceType': request.resourceType,
+        }
+        if self._pages:
+            entry['pageref'] = self._pages[-1]['id']
+        self._entries[request] = entry
+
+    def _onResponse(self, request: Request, event: Dict) -> None:
+        entry = self._entries.get(request)
+        if entry is not None:
+            self._setResponse(entry, event.get('response', {}))
+            entry['_responseTime'] = event.get('timestamp', 0)
+
+    def _onRequestFinished(self, request: Request, event: Dict) -> None:
+        entry = self._entries.pop(request, None)
+        if entry is None:
+            return
+        transferSize = event.get('encodedDataLength', 0)
+        self._finishEntry(entry, event.get('timestamp', 0), transferSize)
+        response = request.response
+        if (response is None or not self._embedContent or
+                self._maxContentSize and transferSize > self._maxContentSize or  # noqa: E501
+                self._contentFilter and
+                not urlMatches(response, self._contentFilter)):
+            self._writeEntry(entry)
+            return
+        task = self._client._loop.create_task(
+            self._writeEntryWithContent(entry, response))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _onRequestFailed(self, request: Request, event: Dict) -> None:
+        entry = self._entries.pop(request, None)
+        if entry is None:
+            return
+        if entry['response'] is None:
+            self._setResponse(entry, {})
+        entry['_failureText'] = event.get('errorText', '')
+        self._finishEntry(entry, event.get('timestamp', 0), 0)
+        self._writeEntry(entry)
+
+    def _onRequestEvicted(self, request: Request) -> None:
+        self._entries.pop(request, None)
+
+    def _setResponse(self, entry: Dict, response: Dict) -> None:
+        headers = response.get('headers', {})
+        location = ''
+        for name, value in headers.items():
+            if name.lower() == 'location':
+                location = value
+        entry['response'] = {
+            'status': response.get('status', 0),
+            'statusText': response.get('statusText', ''),
+            'httpVersion': _httpVersion(response.get('protocol', '')),
+            'cookies': [],
+            'headers': headersArray(headers),
+            'content': {
+                'size': 0,
+                'mimeType': response.get('mimeType', 'x-unknown'),
+            },
+            'redirectURL': location,
+            'headersSize': -1,
+            'bodySize': -1,
+        }
+        entry['_timing'] = response.get('timing')
+        entry['_headersSize'] = response.get('encodedDataLength', 0)
+        if response.get('remoteIPAddress'):
+            entry['serverIPAddress'] = response['remoteIPAddress']
+        if response.get('connectionId'):
+            entry['connection'] = str(response['connectionId'])
+        if response.get('fromDiskCache') or response.get('fromServiceWorker'):
+            entry['cache'] = {'beforeRequest': None}
+
+    def _finishEntry(self, entry: Dict, endTime: float, transferSize: int
+                     ) -> None:
+        if entry['response'] is None:
+            self._setResponse(entry, {})
+        requestTime = entry.pop('_requestTime')
+        responseTime = entry.pop('_responseTime', endTime)
+        headersSize = entry.pop('_headersSize')
+        timings = harTimings(entry.pop('_timing'), requestTime, responseTime,
+                             endTime)
+        entry['timings'] = timings
+        entry['time'] = round(sum(
+            value for name, value in timings.items()
+            if name != 'ssl' and value > 0
+        ), 3)
+        if transferSize:
+            bodySize = max(transferSize - headersSize, 0)
+            entry['response']['bodySize'] = bodySize
+            entry['response']['content']['size'] = bodySize
+            entry['response']['_transferSize'] = transferSize
+
+    async def _writeEntryWithContent(self, entry: Dict, response: Response
+                                     ) -> None:
+        try:
+            if response._contentPromise is not None:
+                body = await response._contentPromise
+            else:
+                body = await response._bufread()
+        except Exception as e:
+            debugError(logger, e)
+        else:
+            _setContent(entry['response']['content'], body)
+        self._writeEntry(entry)
+
+    def _writeEntry(self, entry: Dict) -> None:
+        if self._writer is not None:
+            self._writer.write(entry)
+
+
+class HarWriter(object):
+    """Write a HAR log incrementally, one entry at a time."""
+
+    def __init__(self, path: str) -> None:
+        """Make new HAR writer and write the log header to ``path``."""
+        self._file: IO[str] = open(path, 'w', encoding='utf-8')
+        self._count = 0
+        creator = json.dumps({'name': 'pyppeteer', 'version': __version__})
+        self._file.write(
+            f'{{"log": {{"version": "1.2", "creator": {creator}, '
+            f'"entries": [\n'
+        )
+
+    def write(self, entry: Dict) -> None:
+        """Append an entry to the log."""
+        if self._count:
+            self._file.write(',\n')
+        self._file.write(json.dumps(entry, ensure_ascii=False))
+        self._count += 1
+
+    def close(self, pages: List[Dict]) -> None:
+        """Write ``pages`` and close the log."""
+        try:
+            self._file.write(f'\n], "pages": {json.dumps(pages)}}}}}\n')
+        finally:
+            self._file.close()
+
+
+class HarArchive(object):
+    """HarArchive class.
+
+    HarArchive indexes the entries of a HAR file by method, URL and a hash of
+    the post data, to answer requests from it in
+    :meth:`~pyppeteer.page.Page.setReplayArchive`. Requests recorded several
+    times are answered with the recorded responses in order, repeating the
+    last one.
+
+    ``hits`` counts answered requests and ``misses`` lists method and URL of
+    every request which was not found in the archive.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Make new archive from HAR file at ``path``."""
+        with open(path, encoding='utf-8') as f:
+            entries = json.load(f)['log']['entries']
+        self._index: Dict[Tuple[str, str, str], List[Dict]] = {}
+        for entry in entries:
+            request = entry['request']
+            postData = request.get('postData', {}).get('text')
+            key = _archiveKey(request['method'], request['url'], postData)
+            self._index.setdefault(key, []).append(entry)
+        self._served: Dict[Tuple[str, str, str], int] = {}
+        self.hits = 0
+        self.misses: List[Dict[str, str]] = []
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._index.values())
+
+    def lookup(self, method: str, url: str, postData: Optional[str] = None
+               ) -> Optional[Dict]:
+        """Find the recorded entry to answer a request with.
+
+        Requests without a recorded entry are added to :attr:`misses`.
+        """
+        key = _archiveKey(method, url, postData)
+        entries = self._index.get(key)
+        if not entries:
+            self.misses.append({'method': method, 'url': url})
+            return None
+        served = self._served.get(key, 0)
+        self._served[key] = served + 1
+        self.hits += 1
+        return entries[min(served, len(entries) - 1)]
+
+    def fulfillParams(self, entry: Dict) -> Optional[Dict[str, Any]]:
+        """Convert a recorded entry to ``Fetch.fulfillRequest`` parameters.
+
+        Return ``None`` if the recorded request failed.
+        """
+        response = entry['response']
+        if not response.get('status'):
+            return None
+        headers = [
+            header for header in response.get('headers', [])
+            if not header['name'].startswith(':') and
+            header['name'].lower() not in replayDroppedHeaders
+        ]
+        params = {
+            'responseCode': response['status'],
+            'responseHeaders': headers,
+        }
+        statusText = (response.get('statusText') or
+                      statusTexts.get(str(response['status'])))
+        if statusText:
+            params['responsePhrase'] = statusText
+        content = response.get('content', {})
+        if content.get('text'):
+            if content.get('encoding') == 'base64':
+                params['body'] = content['text']
+            else:
+                params['body'] = base64.b64encode(
+                    content['text'].encode('utf-8')).decode('ascii')
+        return params
+
+
+def harTimings(timing: Optional[Dict], requestTime: float,
+               responseTime: float, endTime: float) -> Dict[str, float]:
+    """Convert protocol resource timing to HAR timings in milliseconds.
+
+    ``requestTime``, ``responseTime`` and ``endTime`` are protocol timestamps
+    (in seconds) of the request, its response and its end. ``-1`` marks a
+    phase which did not happen, e.g. ``dns`` for a reused connection.
+    """
+    if not timing:
+        # Cached and data: responses have no resource timing.
+        return {
+            'blocked': -1, 'dns': -1, 'connect': -1, 'ssl': -1, 'send': 0,
+            'wait': _round(max(responseTime - requestTime, 0) * 1000),
+            'receive': _round(max(endTime - responseTime, 0) * 1000),
+        }
+    start = timing.get('requestTime', requestTime)
+    blocked = (start - requestTime) * 1000
+    for phase in ('dnsStart', 'connectStart', 'sendStart'):
+        if timing.get(phase, -1) >= 0:
+            blocked += timing[phase]
+            break
+    sendEnd = timing.get('sendEnd', 0)
+    headersEnd = timing.get('receiveHeadersEnd', sendEnd)
+    return {
+        'blocked': _round(max(blocked, 0)),
+        'dns': _phase(timing, 'dns'),
+        'connect': _phase(timing, 'connect'),
+        'ssl': _phase(timing, 'ssl'),
+        'send': _round(sendEnd - timing.get('sendStart', 0)),
+        'wait': _round(max(headersEnd - sendEnd, 0)),
+        'receive': _round(max((endTime - start) * 1000 - headersEnd, 0)),
+    }
+
+
+def _archiveKey(method: str, url: str, postData: Optional[str]
+                ) -> Tuple[str, str, str]:
+    url = url.split('#', 1)[0]
+    bodyHash = ''
+    if postData:
+        bodyHash = hashlib.sha1(postData.encode('utf-8')).hexdigest()
+    return method.upper(), url, bodyHash
+
+
+def _phase(timing: Dict, name: str) -> float:
+    start = timing.get(f'{name}Start', -1)
+    if start < 0:
+        return -1
+    return _round(timing.get(f'{name}End', start) - start)
+
+
+def _round(value: float) -> float:
+    return round(value, 3)
+
+
+def _httpVersion(protocol: str) -> str:
+    if protocol in ('h2', 'h3'):
+        return f'HTTP/{protocol[1]}'
+    return protocol.upper() or 'HTTP/1.1'
+
+
+def _isText(mimeType: str) -> bool:
+    return mimeType.startswith('text/') or mimeType in textMimeTypes
+
+
+def _setContent(content: Dict, body: bytes) -> None:
+    content['size'] = len(body)
+    if _isText(content['mimeType']):
+        try:
+            content['text'] = body.decode('utf-8')
+            return
+        except UnicodeDecodeError:
+            pass
+    content['text'] = base64.b64encode(body).decode('ascii')
+    content['encoding'] = 'base64'
+
+
+def _isoformat(wallTime: float) -> str:
+    date = datetime.fromtimestamp(wallTime, timezone.utc)
+    return date.isoformat(timespec='milliseconds').replace('+00:00', 'Z')
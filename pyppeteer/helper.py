@@ -4,16 +4,18 @@
 """Helper functions."""
 
 import asyncio
+import base64
 import json
 import logging
 import math
-from typing import Any, Awaitable, Callable, Dict, List
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List
 
 from pyee import EventEmitter
 
 import pyppeteer
 from pyppeteer.connection import CDPSession
 from pyppeteer.errors import ElementHandleError, TimeoutError
+from pyppeteer.timers import scheduleDeadline
 
 logger = logging.getLogger(__name__)
 
@@ -119,38 +121,53 @@ def releaseObject(client: CDPSession, remoteObject: dict
     return fut_none
 
 
+async def readProtocolStream(client: CDPSession, handle: str,
+                             chunkSize: int = None) -> AsyncIterator[bytes]:
+    """Read protocol stream ``handle`` chunk by chunk with ``IO.read``."""
+    params: Dict[str, Any] = {'handle': handle}
+    if chunkSize:
+        params['size'] = chunkSize
+    try:
+        eof = False
+        while not eof:
+            response = await client.send('IO.read', params)
+            eof = response.get('eof', False)
+            data = response.get('data', '')
+            if response.get('base64Encoded'):
+                yield base64.b64decode(data)
+            elif data:
+                yield data.encode('utf-8')
+    finally:
+        try:
+            await client.send('IO.close', {'handle': handle})
+        except Exception as e:
+            debugError(logger, e)
+
+
 def waitForEvent(emitter: EventEmitter, eventName: str,  # noqa: C901
                  predicate: Callable[[Any], bool], timeout: float,
                  loop: asyncio.AbstractEventLoop) -> Awaitable:
     """Wait for an event emitted from the emitter."""
     promise = loop.create_future()
 
-    def resolveCallback(target: Any) -> None:
-        promise.set_result(target)
-
-    def rejectCallback(exception: Exception) -> None:
-        promise.set_exception(exception)
-
-    async def timeoutTimer() -> None:
-        await asyncio.sleep(timeout / 1000)
-        rejectCallback(
-            TimeoutError('Timeout exceeded while waiting for event'))
-
     def _listener(target: Any) -> None:
-        if not predicate(target):
-            return
-        cleanup()
-        resolveCallback(target)
+        if not promise.done() and predicate(target):
+            promise.set_result(target)
+
+    def _onTimeout() -> None:
+        if not promise.done():
+            promise.set_exception(
+                TimeoutError('Timeout exceeded while waiting for event'))
 
-    listener = addEventListener(emitter, eventName, _listener)
-    if timeout:
-        eventTimeout = loop.create_task(timeoutTimer())
+    listeners = [addEventListener(emitter, eventName, _listener)]
+    deadline = scheduleDeadline(loop, timeout, _onTimeout) if timeout else None
 
-    def cleanup() -> None:
-        removeEventListeners([listener])
-        if timeout:
-            eventTimeout.cancel()
+    def cleanup(fut: asyncio.Future) -> None:
+        removeEventListeners(listeners)
+        if deadline is not None:
+            deadline.cancel()
 
+    promise.add_done_callback(cleanup)
     return promise
 
 
@@ -3,13 +3,13 @@
 
 """Navigator Watcher module."""
 
-import asyncio
-import concurrent.futures
-from typing import Any, Awaitable, Dict, List, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Union
 
 from pyppeteer import helper
 from pyppeteer.errors import TimeoutError
 from pyppeteer.frame_manager import FrameManager, Frame
+from pyppeteer.network_manager import NetworkManager, Request, urlMatches
+from pyppeteer.timers import Deadline, scheduleDeadline
 from pyppeteer.util import merge_dict
 
 
@@ -17,10 +17,15 @@ class NavigatorWatcher:
     """NavigatorWatcher class."""
 
     def __init__(self, frameManager: FrameManager, frame: Frame, timeout: int,
-                 options: Dict = None, **kwargs: Any) -> None:
+                 options: Dict = None,
+                 networkManager: Optional[NetworkManager] = None,
+                 **kwargs: Any) -> None:
         """Make new navigator watcher."""
         options = merge_dict(options, kwargs)
+        self._networkIdleOptions: Optional[Dict] = None
         self._validate_options(options)
+        if self._networkIdleOptions is not None and networkManager is None:
+            raise ValueError('`networkidle` option needs a network manager.')
         self._frameManager = frameManager
         self._frame = frame
         self._initialLoaderId = frame._loaderId
@@ -44,12 +49,15 @@ class NavigatorWatcher:
             ),
         ]
         self._loop = self._frameManager._client._loop
-        self._lifecycleCompletePromise = self._loop.create_future()
-
-        self._navigationPromise = self._loop.create_task(asyncio.wait([
-            self._lifecycleCompletePromise,
-            self._createTimeoutPromise(),
-        ], return_when=concurrent.futures.FIRST_COMPLETED))
+        self._navigationPromise = self._loop.create_future()
+        self._timeoutDeadline: Optional[Deadline] = None
+        if self._timeout:
+            self._timeoutDeadline = scheduleDeadline(
+                self._loop, self._timeout, self._onTimeout)
+        self._networkIdle = True
+        self._idleTimer: Optional[Deadline] = None
+        if networkManager is not None and self._networkIdleOptions is not None:
+            self._watchNetworkIdle(networkManager)
         self._navigationPromise.add_done_callback(
             lambda fut: self._cleanup())
 
@@ -72,37 +80,100 @@ class NavigatorWatcher:
         _waitUntil = options.get('waitUntil', 'load')
         if isinstance(_waitUntil, list):
             waitUntil = _waitUntil
-        elif isinstance(_waitUntil, str):
+        elif isinstance(_waitUntil, (str, dict)):
             waitUntil = [_waitUntil]
         else:
             raise TypeError(
-                '`waitUntil` option should be str or list of str, '
+                '`waitUntil` option should be str, dict or list of them, '
                 f'but got type {type(_waitUntil)}'
             )
         self._expectedLifecycle: List[str] = []
         for value in waitUntil:
+            if isinstance(value, dict):
+                if set(value) != {'networkidle'}:
+                    raise ValueError(
+                        f'Unknown value for options.waitUntil: {value}')
+                self._networkIdleOptions = value['networkidle'] or {}
+                continue
             protocolEvent = pyppeteerToProtocolLifecycle.get(value)
             if protocolEvent is None:
                 raise ValueError(
                     f'Unknown value for options.waitUntil: {value}')
             self._expectedLifecycle.append(protocolEvent)
 
-    def _createTimeoutPromise(self) -> Awaitable[None]:
-        self._maximumTimer = self._loop.create_future()
-        if self._timeout:
-            errorMessage = f'Navigation Timeout Exceeded: {self._timeout} ms exceeded.'  # noqa: E501
+    def _watchNetworkIdle(self, networkManager: NetworkManager) -> None:
+        options = self._networkIdleOptions or {}
+        self._maxInflight: int = options.get('maxInflight', 0)
+        self._idleTime: float = options.get('idleTime', 500)
+        self._ignore: List[Union[str, Callable[[Request], bool]]] = list(
+            options.get('ignore', []))
+        self._inflight: Set[Request] = set(
+            request for request in networkManager.inflightRequests()
+            if not self._isIgnored(request)
+        )
+        self._networkIdle = False
+        self._eventListeners.extend([
+            helper.addEventListener(
+                networkManager, NetworkManager.Events.Request,
+                self._onRequest),
+            helper.addEventListener(
+                networkManager, NetworkManager.Events.RequestFinished,
+                self._onRequestDone),
+            helper.addEventListener(
+                networkManager, NetworkManager.Events.RequestFailed,
+                self._onRequestDone),
+            # evicted requests never finish or fail
+            helper.addEventListener(
+                networkManager, NetworkManager.Events.RequestEvicted,
+                self._onRequestDone),
+        ])
+
+    def _isIgnored(self, request: Request) -> bool:
+        return urlMatches(request, self._ignore)
+
+    def _onRequest(self, request: Request) -> None:
+        if not self._isIgnored(request):
+            self._inflight.add(request)
+            self._checkNetworkIdle()
+
+    def _onRequestDone(self, request: Request) -> None:
+        if request in self._inflight:
+            self._inflight.discard(request)
+            self._checkNetworkIdle()
+
+    def _checkNetworkIdle(self) -> None:
+        # Like Chromium's networkIdle lifecycle event, idleness only counts
+        # once the navigation has committed and sticks once it is reached.
+        if self._networkIdle or not self._navigationCommitted():
+            return
+        if len(self._inflight) > self._maxInflight:
+            if self._idleTimer is not None:
+                self._idleTimer.cancel()
+                self._idleTimer = None
+        elif self._idleTimer is None:
+            self._idleTimer = scheduleDeadline(
+                self._loop, self._idleTime, self._onNetworkIdle)
+
+    def _onNetworkIdle(self) -> None:
+        self._idleTimer = None
+        self._networkIdle = True
+        self._checkLifecycleComplete()
 
-            async def _timeout_func() -> None:
-                await asyncio.sleep(self._timeout / 1000)
-                self._maximumTimer.set_exception(TimeoutError(errorMessage))
+    def _navigationCommitted(self) -> bool:
+        return (self._frame._loaderId != self._initialLoaderId or
+                self._hasSameDocumentNavigation)
 
-            self._timeout_timer: Union[asyncio.Task, asyncio.Future] = self._loop.create_task(_timeout_func())  # noqa: E501
-        else:
-            self._timeout_timer = self._loop.create_future()
-        return self._maximumTimer
+    def _onTimeout(self) -> None:
+        if not self._navigationPromise.done():
+            self._navigationPromise.set_exception(TimeoutError(
+                f'Navigation Timeout Exceeded: {self._timeout} ms exceeded.'))
+
+    def navigationPromise(self) -> Awaitable[None]:
+        """Return navigation promise.
 
-    def navigationPromise(self) -> Any:
-        """Return navigation promise."""
+        It resolves when the expected lifecycle events are fired, or raises
+        :class:`~pyppeteer.errors.TimeoutError` when timeout is exceeded.
+        """
         return self._navigationPromise
 
     def _navigatedWithinDocument(self, frame: Frame = None) -> None:
@@ -112,34 +183,34 @@ class NavigatorWatcher:
         self._checkLifecycleComplete()
 
     def _checkLifecycleComplete(self, frame: Frame = None) -> None:
-        if (self._frame._loaderId == self._initialLoaderId and
-                not self._hasSameDocumentNavigation):
+        if not self._navigationCommitted():
             return
-        if not self._checkLifecycle(self._frame, self._expectedLifecycle):
+        if not self._networkIdle:
+            self._checkNetworkIdle()
+            return
+        if not self._frame._hasSubtreeLifecycle(self._expectedLifecycle):
             return
 
-        if not self._lifecycleCompletePromise.done():
-            self._lifecycleCompletePromise.set_result(None)
-
-    def _checkLifecycle(self, frame: Frame, expectedLifecycle: List[str]
-                        ) -> bool:
-        for event in expectedLifecycle:
-            if event not in frame._lifecycleEvents:
-                return False
-        for child in frame.childFrames:
-            if not self._checkLifecycle(child, expectedLifecycle):
-                return False
-        return True
+        if not self._navigationPromise.done():
+            self._navigationPromise.set_result(None)
 
     def cancel(self) -> None:
         """Cancel navigation."""
+        if self._navigationPromise.done():
+            if not self._navigationPromise.cancelled():
+                # mark a timeout nobody waits for anymore as retrieved
+                self._navigationPromise.exception()
+        else:
+            self._navigationPromise.cancel()
         self._cleanup()
 
     def _cleanup(self) -> None:
         helper.removeEventListeners(self._eventListeners)
-        self._lifecycleCompletePromise.cancel()
-        self._maximumTimer.cancel()
-        self._timeout_timer.cancel()
+        if self._timeoutDeadline is not None:
+            self._timeoutDeadline.cancel()
+        if self._idleTimer is not None:
+            self._idleTimer.cancel()
+            self._idleTimer = None
 
 
 pyppeteerToProtocolLifecycle = {
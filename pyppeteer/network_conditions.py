@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Predefined network conditions for Page.emulateNetworkConditions."""
+
+from typing import Dict
+
+# ``download`` and ``upload`` are in bytes per second, ``latency`` in ms.
+# Throughputs and latencies are scaled like in Chrome DevTools' presets to
+# account for the overhead of the real network.
+networkConditions: Dict[str, Dict[str, float]] = {
+    'Slow 3G': {
+        'download': 500 * 1000 / 8 * 0.8,
+        'upload': 500 * 1000 / 8 * 0.8,
+        'latency': 400 * 5,
+    },
+    'Fast 3G': {
+        'download': 1.6 * 1000 * 1000 / 8 * 0.9,
+        'upload': 750 * 1000 / 8 * 0.9,
+        'latency': 150 * 3.75,
+    },
+    'Slow 4G': {
+        'download': 1.6 * 1000 * 1000 / 8 * 0.9,
+        'upload': 750 * 1000 / 8 * 0.9,
+        'latency': 150 * 3.75,
+    },
+    'Fast 4G': {
+        'download': 9 * 1000 * 1000 / 8 * 0.9,
+        'upload': 1.5 * 1000 * 1000 / 8 * 0.9,
+        'latency': 60 * 2.75,
+    },
+    'Cable': {
+        'download': 5 * 1000 * 1000 / 8,
+        'upload': 1000 * 1000 / 8,
+        'latency': 28,
+    },
+}
@@ -5,28 +5,36 @@
 
 import asyncio
 import base64
-from collections import OrderedDict
+import binascii
+from collections import OrderedDict, deque
 import copy
+from fnmatch import fnmatchcase
 import json
 import logging
+import mimetypes
+import mmap
+import os
 from types import SimpleNamespace
-from typing import Awaitable, Dict, List, Optional, Union, TYPE_CHECKING
-from urllib.parse import unquote
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional, Tuple, TypeVar, Union, TYPE_CHECKING  # noqa: E501
 
 from pyee import EventEmitter
 
 from pyppeteer.connection import CDPSession
 from pyppeteer.errors import NetworkError
+from pyppeteer.expiring_map import ExpiringMap
 from pyppeteer.frame_manager import FrameManager, Frame
-from pyppeteer.helper import debugError
-from pyppeteer.multimap import Multimap
+from pyppeteer.helper import debugError, readProtocolStream
 
 if TYPE_CHECKING:
     from typing import Set  # noqa: F401
+    from pyppeteer.har import HarArchive, HarRecorder  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
 
+DEFAULT_MAX_TRACKED_REQUESTS = 10000
+
+
 class NetworkManager(EventEmitter):
     """NetworkManager class."""
 
@@ -35,6 +43,7 @@ class NetworkManager(EventEmitter):
         Response='response',
         RequestFailed='requestfailed',
         RequestFinished='requestfinished',
+        RequestEvicted='requestevicted',
     )
 
     def __init__(self, client: CDPSession, frameManager: FrameManager) -> None:
@@ -42,24 +51,28 @@ class NetworkManager(EventEmitter):
         super().__init__()
         self._client = client
         self._frameManager = frameManager
-        self._requestIdToRequest: Dict[Optional[str], Request] = dict()
-        self._requestIdToResponseWillBeSent: Dict[Optional[str], Dict] = dict()
+        timer = self._client._loop.time
+        self._requestIdToRequest = ExpiringMap(DEFAULT_MAX_TRACKED_REQUESTS, 0, timer)  # noqa: E501
+        self._requestIdToResponseWillBeSent = ExpiringMap(DEFAULT_MAX_TRACKED_REQUESTS, 0, timer)  # noqa: E501
         self._extraHTTPHeaders: OrderedDict[str, str] = OrderedDict()
         self._offline: bool = False
+        self._networkConditions: Optional[Dict[str, float]] = None
         self._credentials: Optional[Dict[str, str]] = None
         self._attemptedAuthentications: Set[Optional[str]] = set()
         self._userRequestInterceptionEnabled = False
         self._protocolRequestInterceptionEnabled = False
-        self._requestHashToRequestIds = Multimap()
-        self._requestHashToInterceptionIds = Multimap()
-
-        self._client.on(
-            'Network.requestWillBeSent',
-            lambda event: self._client._loop.create_task(
-                self._onRequestWillBeSent(event)
-            ),
-        )
-        self._client.on('Network.requestIntercepted', self._onRequestIntercepted)  # noqa: E501
+        self._requestIdToInterceptionId = ExpiringMap(DEFAULT_MAX_TRACKED_REQUESTS, 0, timer)  # noqa: E501
+        self._bodyCapturePatterns: List[Union[str, Callable[[Response], bool]]] = []  # noqa: E501
+        self._harRecorder: Optional[HarRecorder] = None
+        self._replayArchive: Optional[HarArchive] = None
+        self._replayFallthrough = 'abort'
+        self._replayedInterceptionIds = ExpiringMap(DEFAULT_MAX_TRACKED_REQUESTS, 0, timer)  # noqa: E501
+        self._navigationStartTime = 0.0
+        self._loadRecords: Optional[Deque[Dict]] = None
+
+        self._client.on('Fetch.requestPaused', self._onRequestPaused)
+        self._client.on('Fetch.authRequired', self._onAuthRequired)
+        self._client.on('Network.requestWillBeSent', self._onRequestWillBeSent)  # noqa: E501
         self._client.on('Network.requestServedFromCache', self._onRequestServedFromCache)  # noqa: #501
         self._client.on('Network.responseReceived', self._onResponseReceived)
         self._client.on('Network.loadingFinished', self._onLoadingFinished)
@@ -92,13 +105,121 @@ class NetworkManager(EventEmitter):
         if self._offline == value:
             return
         self._offline = value
+        await self._updateNetworkConditions()
+
+    async def emulateNetworkConditions(
+            self, conditions: Optional[Dict[str, float]]) -> None:
+        """Emulate latency and throughput, or stop it if conditions is None."""
+        self._networkConditions = conditions
+        await self._updateNetworkConditions()
+
+    async def _updateNetworkConditions(self) -> None:
+        conditions = self._networkConditions or {}
         await self._client.send('Network.emulateNetworkConditions', {
             'offline': self._offline,
-            'latency': 0,
-            'downloadThroughput': -1,
-            'uploadThroughput': -1,
+            'latency': conditions.get('latency', 0),
+            'downloadThroughput': conditions.get('download', -1),
+            'uploadThroughput': conditions.get('upload', -1),
+        })
+
+    def setResponseBodyCapture(
+            self, patterns: List[Union[str, Callable[['Response'], bool]]]
+    ) -> None:
+        """Capture bodies of matching responses as soon as they finish."""
+        self._bodyCapturePatterns = list(patterns)
+
+    def _captureBody(self, response: 'Response') -> None:
+        def _done(fut: asyncio.Future) -> None:
+            if not fut.cancelled() and fut.exception():
+                debugError(logger, fut.exception())
+
+        response.buffer().add_done_callback(_done)  # type: ignore
+
+    def setRequestTrackingLimits(self, maxRequests: int, maxAge: float
+                                 ) -> None:
+        """Limit the number and age (in seconds) of tracked requests."""
+        for tracked in self._trackedMaps():
+            tracked.maxSize = maxRequests
+            tracked.maxAge = maxAge
+        if self._loadRecords is not None:
+            self._loadRecords = deque(self._loadRecords, maxlen=self._loadRecordsLimit())  # noqa: E501
+        for evicted in self._requestIdToRequest.evict():
+            self._onRequestEvicted(evicted)
+        self._requestIdToResponseWillBeSent.evict()
+        self._requestIdToInterceptionId.evict()
+        self._replayedInterceptionIds.evict()
+
+    def requestTrackingStats(self) -> Dict[str, int]:
+        """Return sizes and eviction counters of the request bookkeeping."""
+        trackedMaps = self._trackedMaps()
+        return {
+            'requests': self._requestIdToRequest.size(),
+            'pendingRequestEvents': self._requestIdToResponseWillBeSent.size(),
+            'pendingInterceptions': self._requestIdToInterceptionId.size(),
+            'evictedByAge': sum(m.evictedByAge for m in trackedMaps),
+            'evictedBySize': sum(m.evictedBySize for m in trackedMaps),
+        }
+
+    def inflightRequests(self) -> List['Request']:
+        """Return requests which have neither finished nor failed yet."""
+        return self._requestIdToRequest.values()
+
+    def startLoadRecording(self) -> None:
+        """Start recording finished requests for :meth:`loadRecords`."""
+        if self._loadRecords is None:
+            self._loadRecords = deque(maxlen=self._loadRecordsLimit())
+
+    def stopLoadRecording(self) -> None:
+        """Stop recording finished requests and drop the records."""
+        self._loadRecords = None
+
+    def loadRecords(self) -> Tuple[float, List[Dict]]:
+        """Return start time and finished requests of the main frame document.
+
+        While recording, records are kept for requests finished or failed
+        since the last main frame navigation, up to the request tracking limit
+        (or ``DEFAULT_MAX_TRACKED_REQUESTS`` if it is disabled).
+        """
+        return self._navigationStartTime, list(self._loadRecords or ())
+
+    def _loadRecordsLimit(self) -> int:
+        return self._requestIdToRequest.maxSize or DEFAULT_MAX_TRACKED_REQUESTS
+
+    def _recordLoad(self, request: 'Request', endTime: float,
+                    transferSize: int) -> None:
+        if self._loadRecords is None:
+            return
+        response = request._response
+        self._loadRecords.append({
+            'url': request._url,
+            'resourceType': request._resourceType,
+            'initiator': request._initiator,
+            'status': response._status if response else 0,
+            'failed': request._failureText is not None,
+            'startTime': request._startTime,
+            'endTime': endTime,
+            'timing': response._timing if response else None,
+            'transferSize': transferSize,
         })
 
+    def _trackedMaps(self) -> List[ExpiringMap]:
+        return [
+            self._requestIdToRequest,
+            self._requestIdToResponseWillBeSent,
+            self._requestIdToInterceptionId,
+            self._replayedInterceptionIds,
+        ]
+
+    def _onRequestEvicted(self, request: 'Request') -> None:
+        self._attemptedAuthentications.discard(request._interceptionId)
+        if self._harRecorder:
+            self._harRecorder._onRequestEvicted(request)
+        response = request.response
+        if response and not response._bodyLoadedPromise.done():
+            response._bodyLoadedPromiseFulfill(NetworkError(
+                'Response body is unavailable: request is no longer tracked'))
+        self.emit(NetworkManager.Events.RequestEvicted, request)
+
     async def setUserAgent(self, userAgent: str) -> None:
         """Set user agent."""
         await self._client.send('Network.setUserAgentOverride',
@@ -109,34 +230,51 @@ class NetworkManager(EventEmitter):
         self._userRequestInterceptionEnabled = value
         await self._updateProtocolRequestInterception()
 
+    async def setReplayArchive(self, archive: Optional['HarArchive'],
+                               fallthrough: str = 'abort') -> None:
+        """Answer requests from archive, or stop it if archive is None."""
+        self._replayArchive = archive
+        self._replayFallthrough = fallthrough
+        await self._updateProtocolRequestInterception()
+
     async def _updateProtocolRequestInterception(self) -> None:
         enabled = (self._userRequestInterceptionEnabled or
-                   bool(self._credentials))
+                   bool(self._credentials) or
+                   self._replayArchive is not None)
         if enabled == self._protocolRequestInterceptionEnabled:
             return
         self._protocolRequestInterceptionEnabled = enabled
-        patterns = [{'urlPattern': '*'}] if enabled else []
-        await asyncio.gather(
-            self._client.send(
-                'Network.setCacheDisabled',
-                {'cacheDisabled': enabled},
-            ),
-            self._client.send(
-                'Network.setRequestInterception',
-                {'patterns': patterns},
+        if enabled:
+            await asyncio.gather(
+                self._client.send(
+                    'Network.setCacheDisabled',
+                    {'cacheDisabled': True},
+                ),
+                self._client.send('Fetch.enable', {
+                    'handleAuthRequests': True,
+                    'patterns': [{'urlPattern': '*'}],
+                }),
+            )
+        else:
+            await asyncio.gather(
+                self._client.send(
+                    'Network.setCacheDisabled',
+                    {'cacheDisabled': False},
+                ),
+                self._client.send('Fetch.disable'),
             )
-        )
 
-    async def _onRequestWillBeSent(self, event: Dict) -> None:
-        if self._protocolRequestInterceptionEnabled:
-            requestHash = generateRequestHash(event.get('request', {}))
-            interceptionId = self._requestHashToInterceptionIds.firstValue(requestHash)  # noqa: E501
+    def _onRequestWillBeSent(self, event: Dict) -> None:
+        # Request interception doesn't happen for data URLs.
+        url = event.get('request', {}).get('url', '')
+        if (self._protocolRequestInterceptionEnabled and
+                not url.startswith('data:')):
+            requestId = event.get('requestId')
+            interceptionId = self._requestIdToInterceptionId.pop(requestId, None)  # noqa: E501
             if interceptionId:
                 self._onRequest(event, interceptionId)
-                self._requestHashToInterceptionIds.delete(requestHash, interceptionId)  # noqa: E501
             else:
-                self._requestHashToRequestIds.set(requestHash, event.get('requestId'))  # noqa: E501
-                self._requestIdToResponseWillBeSent[event.get('requestId')] = event  # noqa: E501
+                self._requestIdToResponseWillBeSent.set(requestId, event)
             return
         self._onRequest(event, None)
 
@@ -146,46 +284,84 @@ class NetworkManager(EventEmitter):
         except Exception as e:
             debugError(logger, e)
 
-    def _onRequestIntercepted(self, event: dict) -> None:  # noqa: C901
-        if event.get('authChallenge'):
-            response = 'Default'
-            if event['interceptionId'] in self._attemptedAuthentications:
-                response = 'CancelAuth'
-            elif self._credentials:
-                response = 'ProvideCredentials'
-                self._attemptedAuthentications.add(event['interceptionId'])
-            username = getattr(self, '_credentials', {}).get('username')
-            password = getattr(self, '_credentials', {}).get('password')
-
-            self._client._loop.create_task(self._send(
-                'Network.continueInterceptedRequest', {
-                    'interceptionId': event['interceptionId'],
-                    'authChallengeResponse': {
-                        'response': response,
-                        'username': username,
-                        'password': password,
-                    }
+    def _onAuthRequired(self, event: Dict) -> None:
+        response = 'Default'
+        if event['requestId'] in self._attemptedAuthentications:
+            response = 'CancelAuth'
+        elif self._credentials:
+            response = 'ProvideCredentials'
+            self._attemptedAuthentications.add(event['requestId'])
+        credentials = self._credentials or {}
+        self._client._loop.create_task(self._send(
+            'Fetch.continueWithAuth', {
+                'requestId': event['requestId'],
+                'authChallengeResponse': {
+                    'response': response,
+                    'username': credentials.get('username'),
+                    'password': credentials.get('password'),
                 }
-            ))
-            return
+            }
+        ))
 
-        if (not self._userRequestInterceptionEnabled and
+    def _onRequestPaused(self, event: Dict) -> None:
+        if 'responseStatusCode' in event or 'responseErrorReason' in event:
+            self._onResponsePaused(event)
+            return
+        requestId = event.get('networkId')
+        interceptionId = event['requestId']
+        archive = self._replayArchive
+        if archive is not None and self._replayRequest(archive, event):
+            self._replayedInterceptionIds.set(interceptionId, True)
+        elif (not self._userRequestInterceptionEnabled and
                 self._protocolRequestInterceptionEnabled):
             self._client._loop.create_task(self._send(
-                'Network.continueInterceptedRequest', {
-                    'interceptionId': event['interceptionId'],
-                }
+                'Fetch.continueRequest', {'requestId': interceptionId}
             ))
 
-        requestHash = generateRequestHash(event['request'])
-        requestId = self._requestHashToRequestIds.firstValue(requestHash)
-        if requestId:
-            requestWillBeSentEvent = self._requestIdToResponseWillBeSent[requestId]  # noqa: E501
-            self._onRequest(requestWillBeSentEvent, event.get('interceptionId'))  # noqa: E501
-            self._requestHashToRequestIds.delete(requestHash, requestId)
-            self._requestIdToResponseWillBeSent.pop(requestId, None)
+        requestWillBeSentEvent = self._requestIdToResponseWillBeSent.pop(
+            requestId, None)
+        if requestId and requestWillBeSentEvent:
+            self._onRequest(requestWillBeSentEvent, interceptionId)
+        else:
+            self._requestIdToInterceptionId.set(requestId, interceptionId)
+
+    def _replayRequest(self, archive: 'HarArchive', event: Dict) -> bool:
+        request = event.get('request', {})
+        entry = archive.lookup(request.get('method', 'GET'),
+                               request.get('url', ''),
+                               request.get('postData'))
+        if entry is None and self._replayFallthrough == 'continue':
+            return False
+        params = archive.fulfillParams(entry) if entry else None
+        if params is None:
+            method = 'Fetch.failRequest'
+            params = {'errorReason': errorReasons['failed']}
+            if entry is None:
+                params['errorReason'] = errorReasons['internetdisconnected']
         else:
-            self._requestHashToInterceptionIds.set(requestHash, event['interceptionId'])  # noqa: E501
+            method = 'Fetch.fulfillRequest'
+        params['requestId'] = event['requestId']
+        self._client._loop.create_task(self._send(method, params))
+        return True
+
+    def _onResponsePaused(self, event: Dict) -> None:
+        # Only requests continued with ``interceptResponse`` pause here.
+        request = self._requestIdToRequest.get(event.get('networkId'))
+        status = event.get('responseStatusCode', 0)
+        if (not request or 'responseErrorReason' in event or
+                300 <= status <= 399):
+            self._client._loop.create_task(self._send(
+                'Fetch.continueRequest', {'requestId': event['requestId']}
+            ))
+            return
+        headers = {header['name']: header['value']
+                   for header in event.get('responseHeaders', [])}
+        response = Response(self._client, request, status, headers,
+                            False, False)
+        response._interceptionId = event['requestId']
+        response._intercepted = True
+        request._response = response
+        self.emit(NetworkManager.Events.Response, response)
 
     def _onRequest(self, event: Dict, interceptionId: Optional[str]) -> None:
         redirectChain: List[Request] = list()
@@ -202,12 +378,15 @@ class NetworkManager(EventEmitter):
                     redirectResponse.get('SecurityDetails'),
                 )
                 redirectChain = request._redirectChain
+                request._response._timing = redirectResponse.get('timing')
+                self._recordLoad(request, event.get('timestamp', 0),
+                                 redirectResponse.get('encodedDataLength', 0))
 
         isNavigationRequest = bool(
             event.get('requestId') == event.get('loaderId') and
             event.get('type') == 'Document'
         )
-        self._handleRequestStart(
+        request = self._handleRequestStart(
             event['requestId'],
             interceptionId,
             event.get('request', {}).get('url'),
@@ -217,6 +396,16 @@ class NetworkManager(EventEmitter):
             event.get('frameId'),
             redirectChain,
         )
+        request._startTime = event.get('timestamp', 0)
+        request._initiator = _initiatorURL(event.get('initiator', {}))
+        if (isNavigationRequest and not redirectChain and
+                request._frame is not None and
+                request._frame.parentFrame is None):
+            self._navigationStartTime = request._startTime
+            if self._loadRecords is not None:
+                self._loadRecords.clear()
+        if self._harRecorder:
+            self._harRecorder._onRequest(request, event)
 
     def _onRequestServedFromCache(self, event: Dict) -> None:
         request = self._requestIdToRequest.get(event.get('requestId'))
@@ -245,7 +434,7 @@ class NetworkManager(EventEmitter):
                             isNavigationRequest: bool, resourceType: str,
                             requestPayload: Dict, frameId: Optional[str],
                             redirectChain: List['Request']
-                            ) -> None:
+                            ) -> 'Request':
         frame = None
         if frameId and self._frameManager is not None:
             frame = self._frameManager.frame(frameId)
@@ -254,14 +443,23 @@ class NetworkManager(EventEmitter):
                           isNavigationRequest,
                           self._userRequestInterceptionEnabled, url,
                           resourceType, requestPayload, frame, redirectChain)
-        self._requestIdToRequest[requestId] = request
+        if self._replayedInterceptionIds.pop(interceptionId, False):
+            request._fromArchive = True
+        for evicted in self._requestIdToRequest.set(requestId, request):
+            self._onRequestEvicted(evicted)
         self.emit(NetworkManager.Events.Request, request)
+        return request
 
     def _onResponseReceived(self, event: dict) -> None:
         request = self._requestIdToRequest.get(event['requestId'])
         # FileUpload sends a response without a matching request.
         if not request:
             return
+        if self._harRecorder:
+            self._harRecorder._onResponse(request, event)
+        # Responses paused at the response stage are already reported.
+        if request._response is not None and request._response._intercepted:
+            return
         _resp = event.get('response', {})
         response = Response(self._client, request,
                             _resp.get('status', 0),
@@ -269,6 +467,7 @@ class NetworkManager(EventEmitter):
                             _resp.get('fromDiskCache'),
                             _resp.get('fromServiceWorker'),
                             _resp.get('securityDetails'))
+        response._timing = _resp.get('timing')
         request._response = response
         self.emit(NetworkManager.Events.Response, response)
 
@@ -281,8 +480,16 @@ class NetworkManager(EventEmitter):
         response = request.response
         if response:
             response._bodyLoadedPromiseFulfill(None)
+            if urlMatches(response, self._bodyCapturePatterns):
+                self._captureBody(response)
         self._requestIdToRequest.pop(request._requestId, None)
         self._attemptedAuthentications.discard(request._interceptionId)
+        transferSize = event.get('encodedDataLength', 0)
+        if response:
+            response._transferSize = transferSize
+        self._recordLoad(request, event.get('timestamp', 0), transferSize)
+        if self._harRecorder:
+            self._harRecorder._onRequestFinished(request, event)
         self.emit(NetworkManager.Events.RequestFinished, request)
 
     def _onLoadingFailed(self, event: dict) -> None:
@@ -297,6 +504,9 @@ class NetworkManager(EventEmitter):
             response._bodyLoadedPromiseFulfill(None)
         self._requestIdToRequest.pop(request._requestId, None)
         self._attemptedAuthentications.discard(request._interceptionId)
+        self._recordLoad(request, event.get('timestamp', 0), 0)
+        if self._harRecorder:
+            self._harRecorder._onRequestFailed(request, event)
         self.emit(NetworkManager.Events.RequestFailed, request)
 
 
@@ -320,6 +530,14 @@ class Request(object):
     to a redirect url.
     """
 
+    __slots__ = (
+        '_client', '_requestId', '_isNavigationRequest', '_interceptionId',
+        '_allowInterception', '_interceptionHandled', '_response',
+        '_failureText', '_url', '_resourceType', '_method', '_postData',
+        '_headers', '_frame', '_redirectChain', '_fromMemoryCache',
+        '_fromArchive', '_startTime', '_initiator',
+    )
+
     def __init__(self, client: CDPSession, requestId: Optional[str],
                  interceptionId: Optional[str], isNavigationRequest: bool,
                  allowInterception: bool, url: str, resourceType: str,
@@ -345,6 +563,9 @@ class Request(object):
         self._redirectChain = redirectChain
 
         self._fromMemoryCache = False
+        self._fromArchive = False
+        self._startTime = 0.0
+        self._initiator: Optional[str] = None
 
     @property
     def url(self) -> str:
@@ -438,9 +659,22 @@ class Request(object):
 
         * ``url`` (str): If set, the request url will be changed.
         * ``method`` (str): If set, change the request method (e.g. ``GET``).
-        * ``postData`` (str): If set, change the post data or request.
+        * ``postData`` (str|bytes): If set, change the post data or request.
         * ``headers`` (dict): If set, change the request HTTP header.
+        * ``interceptResponse`` (bool): If set, pause the request again when
+          its response headers are received. The ``response`` event is then
+          emitted with a paused :class:`Response`, whose body can be read with
+          :meth:`Response.iterBody` or :meth:`Response.save` without being
+          buffered, or which can be passed to the page with
+          :meth:`Response.continue_`.
+
+        Requests to ``data:`` URLs and requests answered from a replay archive
+        (see :meth:`pyppeteer.page.Page.setReplayArchive`) are never
+        intercepted, so this method does nothing for them.
         """
+        # Request interception is not supported for data: urls.
+        if self._fromArchive or self._url.startswith('data:'):
+            return
         if overrides is None:
             overrides = {}
 
@@ -450,10 +684,10 @@ class Request(object):
             raise NetworkError('Request is already handled.')
 
         self._interceptionHandled = True
-        opt = {'interceptionId': self._interceptionId}
-        opt.update(overrides)
+        opt: Dict[str, Any] = {'requestId': self._interceptionId}
+        opt.update(_continueOverrides(overrides))
         try:
-            await self._client.send('Network.continueInterceptedRequest', opt)
+            await self._client.send('Fetch.continueRequest', opt)
         except Exception as e:
             debugError(logger, e)
 
@@ -470,9 +704,16 @@ class Request(object):
         * ``headers`` (dict): Optional response headers.
         * ``contentType`` (str): If set, equals to setting ``Content-Type``
           response header.
-        * ``body`` (str|bytes): Optional response body.
+        * ``body`` (str|bytes|bytearray|memoryview): Optional response body.
+        * ``path`` (str): Path to a file to use as the response body. The file
+          is memory-mapped instead of being read, and ``Content-Type`` is
+          guessed from its extension unless given explicitly. Takes priority
+          over ``body``.
+
+        The body is base64-encoded once, directly from the given buffer, and
+        sent with ``Fetch.fulfillRequest`` together with the headers.
         """
-        if self._url.startswith('data:'):
+        if self._fromArchive or self._url.startswith('data:'):
             return
         if not self._allowInterception:
             raise NetworkError('Request interception is not enabled.')
@@ -480,39 +721,40 @@ class Request(object):
             raise NetworkError('Request is already handled.')
         self._interceptionHandled = True
 
-        if response.get('body') and isinstance(response['body'], str):
-            responseBody: Optional[bytes] = response['body'].encode('utf-8')
-        else:
-            responseBody = response.get('body')
-
         responseHeaders = {}
         if response.get('headers'):
             for header in response['headers']:
                 responseHeaders[header.lower()] = response['headers'][header]
         if response.get('contentType'):
             responseHeaders['content-type'] = response['contentType']
-        if responseBody and 'content-length' not in responseHeaders:
-            responseHeaders['content-length'] = len(responseBody)
+
+        path = response.get('path')
+        if path:
+            if 'content-type' not in responseHeaders:
+                mimeType, _ = mimetypes.guess_type(path)
+                if mimeType:
+                    responseHeaders['content-type'] = mimeType
+            body, bodyLength = _base64FromFile(path)
+        elif response.get('body'):
+            body, bodyLength = _base64FromBuffer(response['body'])
+        else:
+            body, bodyLength = '', 0
+        if bodyLength and 'content-length' not in responseHeaders:
+            responseHeaders['content-length'] = bodyLength
 
         statusCode = response.get('status', 200)
-        statusText = statusTexts.get(statusCode, '')
-        statusLine = f'HTTP/1.1 {statusCode} {statusText}'
-
-        CRLF = '\r\n'
-        text = statusLine + CRLF
-        for header in responseHeaders:
-            text = f'{text}{header}: {responseHeaders[header]}{CRLF}'
-        text = text + CRLF
-        responseBuffer = text.encode('utf-8')
-        if responseBody:
-            responseBuffer = responseBuffer + responseBody
-
-        rawResponse = base64.b64encode(responseBuffer).decode('ascii')
+        opt = {
+            'requestId': self._interceptionId,
+            'responseCode': statusCode,
+            'responseHeaders': headersArray(responseHeaders),
+        }
+        statusText = statusTexts.get(str(statusCode))
+        if statusText:
+            opt['responsePhrase'] = statusText
+        if body:
+            opt['body'] = body
         try:
-            await self._client.send('Network.continueInterceptedRequest', {
-                'interceptionId': self._interceptionId,
-                'rawResponse': rawResponse,
-            })
+            await self._client.send('Fetch.fulfillRequest', opt)
         except Exception as e:
             debugError(logger, e)
 
@@ -549,6 +791,9 @@ class Request(object):
         - ``timedout``: An operation timed out.
         - ``failed``: A generic failure occurred.
         """
+        # Request interception is not supported for data: urls.
+        if self._fromArchive or self._url.startswith('data:'):
+            return
         errorReason = errorReasons[errorCode]
         if not errorReason:
             raise NetworkError('Unknown error code: {}'.format(errorCode))
@@ -558,8 +803,8 @@ class Request(object):
             raise NetworkError('Request is already handled.')
         self._interceptionHandled = True
         try:
-            await self._client.send('Network.continueInterceptedRequest', dict(
-                interceptionId=self._interceptionId,
+            await self._client.send('Fetch.failRequest', dict(
+                requestId=self._interceptionId,
                 errorReason=errorReason,
             ))
         except Exception as e:
@@ -587,6 +832,13 @@ errorReasons = {
 class Response(object):
     """Response class represents responses which are received by ``Page``."""
 
+    __slots__ = (
+        '_client', '_request', '_status', '_contentPromise',
+        '_bodyLoadedPromise', '_interceptionId', '_intercepted', '_url',
+        '_fromDiskCache', '_fromServiceWorker', '_headers', '_securityDetails',
+        '_timing', '_transferSize',
+    )
+
     def __init__(self, client: CDPSession, request: Request, status: int,
                  headers: Dict[str, str], fromDiskCache: bool,
                  fromServiceWorker: bool, securityDetails: Dict = None
@@ -594,8 +846,12 @@ class Response(object):
         self._client = client
         self._request = request
         self._status = status
-        self._contentPromise = self._client._loop.create_future()
+        self._contentPromise: Optional[asyncio.Future] = None
         self._bodyLoadedPromise = self._client._loop.create_future()
+        self._interceptionId: Optional[str] = None
+        self._intercepted = False
+        self._timing: Optional[Dict] = None
+        self._transferSize: Optional[int] = None
 
         self._url = request.url
         self._fromDiskCache = fromDiskCache
@@ -659,11 +915,111 @@ class Response(object):
         return body
 
     def buffer(self) -> Awaitable[bytes]:
-        """Return awaitable which resolves to bytes with response body."""
-        if not self._contentPromise.done():
-            return self._client._loop.create_task(self._bufread())
+        """Return awaitable which resolves to bytes with response body.
+
+        The body is fetched once and kept on this response, so :meth:`text`
+        and :meth:`json` share a single ``Network.getResponseBody`` call. Use
+        :meth:`release` to drop the kept body. A failed fetch is not kept, so
+        the next call tries again.
+        """
+        if self._contentPromise is None:
+            future = self._client._loop.create_task(self._bufread())
+            self._contentPromise = future
+
+            def _forget(fut: asyncio.Future) -> None:
+                if fut.cancelled() or fut.exception() is not None:
+                    if self._contentPromise is fut:
+                        self._contentPromise = None
+
+            future.add_done_callback(_forget)
         return self._contentPromise
 
+    def release(self) -> None:
+        """Drop the response body kept by :meth:`buffer`.
+
+        A later call to :meth:`buffer` fetches the body again, which fails if
+        the browser has evicted it in the meantime.
+        """
+        self._contentPromise = None
+
+    async def iterBody(self, chunkSize: int = 1024 * 1024
+                       ) -> AsyncIterator[bytes]:
+        """Iterate over the response body in chunks of ``chunkSize`` bytes.
+
+        If the response is paused at the response stage (see the
+        ``interceptResponse`` option of :meth:`Request.continue_`), the body is
+        taken with ``Fetch.takeResponseBodyAsStream`` and read through the IO
+        domain one chunk at a time, so it is never held in memory as a whole.
+        The body is consumed by this method, and the request is aborted for
+        the page once it has been read.
+
+        Otherwise, the body is fetched once and yielded in chunks. It is kept
+        on the response only if :meth:`buffer` was called before.
+
+        .. code::
+
+            async for chunk in response.iterBody():
+                handle(chunk)
+        """
+        interceptionId = self._interceptionId
+        if interceptionId is None:
+            if self._contentPromise is not None:
+                content = await self._contentPromise
+            else:
+                content = await self._bufread()
+            if isinstance(content, str):
+                content = content.encode('utf-8')
+            for start in range(0, len(content), chunkSize):
+                yield content[start:start + chunkSize]
+            return
+
+        self._interceptionId = None
+        try:
+            result = await self._client.send(
+                'Fetch.takeResponseBodyAsStream',
+                {'requestId': interceptionId},
+            )
+            async for chunk in readProtocolStream(
+                    self._client, result['stream'], chunkSize):
+                yield chunk
+        finally:
+            try:
+                await self._client.send('Fetch.failRequest', {
+                    'requestId': interceptionId,
+                    'errorReason': 'Aborted',
+                })
+            except Exception as e:
+                debugError(logger, e)
+
+    async def save(self, path: str, chunkSize: int = 1024 * 1024) -> int:
+        """Write the response body to the file at ``path``.
+
+        The body is read with :meth:`iterBody` and written chunk by chunk.
+        Return the number of bytes written.
+        """
+        written = 0
+        with open(path, 'wb') as f:
+            async for chunk in self.iterBody(chunkSize):
+                f.write(chunk)
+                written += len(chunk)
+        return written
+
+    async def continue_(self) -> None:
+        """Pass a response paused at the response stage on to the page.
+
+        Every paused response has to be either continued, or have its body
+        consumed by :meth:`iterBody` or :meth:`save`.
+        """
+        if self._interceptionId is None:
+            raise NetworkError('Response is not paused.')
+        interceptionId = self._interceptionId
+        self._interceptionId = None
+        try:
+            await self._client.send('Fetch.continueRequest',
+                                    {'requestId': interceptionId})
+        except Exception as e:
+            debugError(logger, e)
+
     async def text(self) -> str:
         """Get text representation of response body."""
         content = await self.buffer()
@@ -695,42 +1051,105 @@ class Response(object):
         """Return ``True`` if the response was served by a service worker."""
         return self._fromServiceWorker
 
+    @property
+    def timing(self) -> Optional[Dict]:
+        """Return resource timing of the response, if any.
+
+        It is a dictionary of the protocol's ``Network.ResourceTiming``:
+        ``requestTime`` is a timestamp in seconds, other fields like
+        ``dnsStart``, ``connectEnd`` or ``receiveHeadersEnd`` are milliseconds
+        relative to it, ``-1`` if the phase did not happen. Cached responses
+        have no timing.
+        """
+        return self._timing
+
+    @property
+    def transferSize(self) -> Optional[int]:
+        """Return number of bytes transferred for this response.
 
-def generateRequestHash(request: dict) -> str:
-    """Generate request hash."""
-    normalizedURL = request.get('url', '')
-    try:
-        normalizedURL = unquote(normalizedURL)
-    except Exception:
-        pass
-
-    _hash = {
-        'url': normalizedURL,
-        'method': request.get('method'),
-        'postData': request.get('postData'),
-        'headers': {},
-    }
-
-    if not normalizedURL.startswith('data:'):
-        headers = list(request['headers'].keys())
-        headers.sort()
-        for header in headers:
-            headerValue = request['headers'][header]
-            header = header.lower()
-            if header in [
-                'accept',
-                'referer',
-                'x-devtools-emulate-network-conditions-client-id',
-                'cookie',
-            ]:
-                continue
-            _hash['headers'][header] = headerValue
-    return json.dumps(_hash)
+        The size includes headers and is known once the request has finished,
+        ``None`` before.
+        """
+        return self._transferSize
+
+
+def _base64FromBuffer(
+        body: Union[str, bytes, bytearray, memoryview, mmap.mmap]
+) -> Tuple[str, int]:
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    with memoryview(body) as view:
+        encoded = binascii.b2a_base64(view, newline=False)
+        return encoded.decode('ascii'), view.nbytes
+
+
+def _continueOverrides(overrides: Dict) -> Dict[str, Any]:
+    # Convert continue_() overrides to Fetch.continueRequest parameters.
+    params = dict(overrides)
+    postData = overrides.get('postData')
+    if postData is not None:
+        if isinstance(postData, str):
+            postData = postData.encode('utf-8')
+        params['postData'] = base64.b64encode(postData).decode('ascii')
+    if overrides.get('headers') is not None:
+        params['headers'] = headersArray(overrides['headers'])
+    return params
+
+
+def _base64FromFile(path: str) -> Tuple[str, int]:
+    with open(path, 'rb') as f:
+        # empty files cannot be memory-mapped
+        if not os.fstat(f.fileno()).st_size:
+            return '', 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return _base64FromBuffer(buffer)
+
+
+def _initiatorURL(initiator: Dict) -> Optional[str]:
+    if initiator.get('url'):
+        return initiator['url']
+    stack = initiator.get('stack')
+    while stack:
+        for callFrame in stack.get('callFrames', []):
+            if callFrame.get('url'):
+                return callFrame['url']
+        stack = stack.get('parent')
+    return None
+
+
+_UrlObject = TypeVar('_UrlObject', Request, Response)
+
+
+def urlMatches(obj: _UrlObject,
+               patterns: List[Union[str, Callable[[_UrlObject], bool]]]
+               ) -> bool:
+    """Check if a request or response matches any URL wildcard or predicate.
+
+    String patterns are matched against ``obj.url``; predicates are called
+    with ``obj`` itself.
+    """
+    for pattern in patterns:
+        if isinstance(pattern, str):
+            if fnmatchcase(obj.url, pattern):
+                return True
+        elif pattern(obj):
+            return True
+    return False
+
+
+def headersArray(headers: Dict[str, str]) -> List[Dict[str, str]]:
+    """Convert headers dictionary to the protocol ``HeaderEntry`` list."""
+    return [{'name': name, 'value': str(value)}
+            for name, value in headers.items()]
 
 
 class SecurityDetails(object):
     """Class represents responses which are received by page."""
 
+    __slots__ = (
+        '_subjectName', '_issuer', '_validFrom', '_validTo', '_protocol',
+    )
+
     def __init__(self, subjectName: str, issuer: str, validFrom: int,
                  validTo: int, protocol: str) -> None:
         self._subjectName = subjectName
@@ -9,8 +9,10 @@ import json
 import logging
 import math
 import mimetypes
+import random
+import weakref
 from types import SimpleNamespace
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Union
 
 from pyee import EventEmitter
 from pyppeteer import helper
@@ -20,13 +22,15 @@ from pyppeteer.dialog import Dialog
 from pyppeteer.element_handle import ElementHandle
 from pyppeteer.emulation_manager import EmulationManager
 from pyppeteer.errors import PageError
-from pyppeteer.execution_context import JSHandle  # noqa: F401
+from pyppeteer.execution_context import HandleScope, JSHandle  # noqa: F401
 from pyppeteer.frame_manager import Frame  # noqa: F401
-from pyppeteer.frame_manager import FrameManager
+from pyppeteer.frame_manager import FrameManager, UTILITY_WORLD_NAME
+from pyppeteer.har import HarArchive, HarRecorder, harTimings
 from pyppeteer.helper import debugError
 from pyppeteer.input import Keyboard, Mouse, Touchscreen
 from pyppeteer.navigator_watcher import NavigatorWatcher
-from pyppeteer.network_manager import NetworkManager, Request, Response
+from pyppeteer.network_conditions import networkConditions
+from pyppeteer.network_manager import DEFAULT_MAX_TRACKED_REQUESTS, NetworkManager, Request, Response
 from pyppeteer.tracing import Tracing
 from pyppeteer.util import merge_dict
 from pyppeteer.worker import Worker
@@ -104,6 +108,7 @@ class Page(EventEmitter):
             client.send('Performance.enable', {}),
             client.send('Log.enable', {}),
         )
+        await page._frameManager._ensureIsolatedWorld(UTILITY_WORLD_NAME)
         if ignoreHTTPSErrors:
             await client.send('Security.setIgnoreCertificateErrors', {'ignore': True})
         if defaultViewport:
@@ -129,11 +134,15 @@ class Page(EventEmitter):
         self._networkManager = NetworkManager(client, self._frameManager)
         self._emulationManager = EmulationManager(client)
         self._tracing = Tracing(client)
+        self._har = HarRecorder(client, self._networkManager)
         self._pageBindings: Dict[str, Callable[..., Any]] = {}
         self._ignoreHTTPSErrors = ignoreHTTPSErrors
         self._defaultNavigationTimeout = 30000  # milliseconds
         self._javascriptEnabled = True
         self._coverage = Coverage(client)
+        self._consoleOptions: Dict[str, Any] = dict()
+        self._consoleWindowStart = 0.0
+        self._consoleWindowCount = 0
         self._viewport: Optional[Dict] = None
 
         if screenshotTaskQueue is None:
@@ -189,7 +198,14 @@ class Page(EventEmitter):
         client.on('Performance.metrics', lambda event: self._emitMetrics(event))
         client.on('Log.entryAdded', lambda event: self._onLogEntryAdded(event))
 
+        browser = self._target.browser
+        self._browserListeners = [
+            helper.addEventListener(browser, browser.Events.Disconnected, lambda: self._har._close())
+        ]
+
         def closed(fut: asyncio.futures.Future) -> None:
+            helper.removeEventListeners(self._browserListeners)
+            self._har._close()
             self.emit(Page.Events.Close)
             self._closed = True
 
@@ -255,6 +271,11 @@ class Page(EventEmitter):
         """Get tracing object."""
         return self._tracing
 
+    @property
+    def har(self) -> HarRecorder:
+        """Get :class:`~pyppeteer.har.HarRecorder` object."""
+        return self._har
+
     @property
     def frames(self) -> List['Frame']:
         """Get all frames of this page."""
@@ -300,10 +321,264 @@ class Page(EventEmitter):
         """  # noqa: E501
         return await self._networkManager.setRequestInterception(value)
 
+    async def setReplayArchive(
+        self, archive: Union[str, HarArchive, None], options: Dict = None, **kwargs: Any
+    ) -> Optional[HarArchive]:
+        """Answer requests of this page from a recorded HAR file.
+
+        :arg archive: Path to a HAR file, e.g. recorded with :attr:`har`, or a
+                      :class:`~pyppeteer.har.HarArchive` to share one archive
+                      between pages. Pass ``None`` to stop replaying.
+
+        Requests are looked up by method, URL and post data. Requests found in
+        the archive are fulfilled with the recorded response and never reach
+        the network or the ``request`` interception handlers.
+
+        Available options are:
+
+        * ``fallthrough`` (str): What to do with requests which are not in the
+          archive. ``'abort'`` (default) fails them, ``'continue'`` sends them
+          to the network, or to the request interception handlers if request
+          interception is enabled.
+
+        Requests missing in the archive are listed in ``misses`` of the
+        returned archive.
+
+        .. code:: python
+
+            archive = await page.setReplayArchive('page.har')
+            await page.goto('https://example.com')
+            print(archive.misses)
+        """
+        options = merge_dict(options, kwargs)
+        fallthrough = options.get('fallthrough', 'abort')
+        if fallthrough not in ('abort', 'continue'):
+            raise PageError(f'Unknown fallthrough option: {fallthrough}')
+        if isinstance(archive, str):
+            archive = HarArchive(archive)
+        await self._networkManager.setReplayArchive(archive, fallthrough)
+        return archive
+
+    def setResponseBodyCapture(self, patterns: List[Union[str, Callable[[Response], bool]]]) -> None:
+        """Fetch bodies of matching responses as soon as they finish loading.
+
+        The browser only keeps response bodies for a limited time, e.g. they
+        are usually evicted once the page navigates away. Bodies of responses
+        matching any of ``patterns`` are fetched right after their
+        ``requestfinished`` event and kept on the
+        :class:`~pyppeteer.network_manager.Response`, so that
+        :meth:`~pyppeteer.network_manager.Response.buffer` never misses them.
+
+        :arg patterns: List of URL wildcard patterns (``*`` and ``?``) or
+                       functions which take a response and return ``True``
+                       if its body should be captured. Pass an empty list to
+                       stop capturing.
+
+        .. code:: python
+
+            page.setResponseBodyCapture(['*/api/*', lambda res: res.status == 200])
+
+        Use :meth:`~pyppeteer.network_manager.Response.release` to free
+        captured bodies which are no longer needed.
+        """
+        self._networkManager.setResponseBodyCapture(patterns)
+
+    def setRequestTrackingLimits(self, options: Dict = None, **kwargs: Any) -> None:
+        """Limit how many requests this page keeps track of.
+
+        Requests are tracked until they finish or fail. Requests which never
+        do (e.g. long-polling or aborted by the browser without notice) are
+        dropped oldest first once a limit is exceeded.
+
+        Available options are:
+
+        * ``maxRequests`` (int): Maximum number of tracked requests, defaults
+          to ``10000``. ``0`` disables the limit.
+        * ``maxAge`` (int|float): Maximum time in milliseconds a request is
+          tracked, defaults to ``0`` (no limit).
+
+        Awaiting :meth:`~pyppeteer.network_manager.Response.buffer` of a
+        dropped request raises
+        :class:`~pyppeteer.errors.NetworkError`. A custom ``networkidle``
+        navigation condition no longer waits for dropped requests.
+        """
+        options = merge_dict(options, kwargs)
+        maxRequests = options.get('maxRequests', DEFAULT_MAX_TRACKED_REQUESTS)
+        maxAge = options.get('maxAge', 0) / 1000
+        self._networkManager.setRequestTrackingLimits(maxRequests, maxAge)
+
+    def requestTrackingStats(self) -> Dict[str, int]:
+        """Get statistics of the request bookkeeping of this page.
+
+        Returned dictionary has the following keys:
+
+        * ``requests``: Number of currently tracked requests.
+        * ``pendingRequestEvents``: Number of request events waiting for
+          their interception.
+        * ``pendingInterceptions``: Number of interceptions waiting for their
+          request event.
+        * ``evictedByAge``: Number of entries dropped by ``maxAge``.
+        * ``evictedBySize``: Number of entries dropped by ``maxRequests``.
+        """
+        return self._networkManager.requestTrackingStats()
+
     async def setOfflineMode(self, enabled: bool) -> None:
         """Set offline mode enable/disable."""
         await self._networkManager.setOfflineMode(enabled)
 
+    async def emulateNetworkConditions(self, conditions: Union[str, Dict[str, float], None]) -> None:
+        """Emulate network latency and throughput.
+
+        :arg conditions: Name of a preset (``'Slow 3G'``, ``'Fast 3G'``,
+                         ``'Slow 4G'``, ``'Fast 4G'`` or ``'Cable'``, see
+                         ``pyppeteer.network_conditions.networkConditions``),
+                         or a dictionary with the following fields. Pass
+                         ``None`` to stop emulation.
+
+        * ``download`` (float): Download throughput in bytes per second,
+          ``-1`` disables throttling.
+        * ``upload`` (float): Upload throughput in bytes per second, ``-1``
+          disables throttling.
+        * ``latency`` (float): Minimum latency of every request in
+          milliseconds.
+
+        Emulation is independent of :meth:`setOfflineMode`.
+
+        .. code:: python
+
+            await page.emulateNetworkConditions('Fast 3G')
+            await page.goto('https://example.com')
+            timings = await page.resourceTimings()
+        """
+        if isinstance(conditions, str):
+            if conditions not in networkConditions:
+                raise PageError(f'Unknown network conditions: {conditions}')
+            conditions = networkConditions[conditions]
+        await self._networkManager.emulateNetworkConditions(conditions)
+
+    async def resourceTimings(self) -> List[Dict[str, Any]]:
+        """Get timing breakdown of the document and resources of this page.
+
+        Timings are taken from the page's
+        `Resource Timing <https://www.w3.org/TR/resource-timing/>`_ entries,
+        so they reflect emulated network conditions. Each item is a dictionary
+        with the following fields, durations are in milliseconds:
+
+        * ``url`` (str): URL of the resource.
+        * ``initiatorType`` (str): ``navigation`` for the document, otherwise
+          e.g. ``script``, ``link``, ``img`` or ``fetch``.
+        * ``startTime`` (float): Start of the fetch relative to the
+          navigation.
+        * ``dns`` (float): DNS lookup.
+        * ``connect`` (float): TCP connection, including TLS.
+        * ``ttfb`` (float): From sending the request to the first byte of the
+          response.
+        * ``download`` (float): Download of the response.
+        * ``duration`` (float): Whole fetch.
+        * ``transferSize`` (int): Transferred bytes, including headers.
+
+        Breakdowns of cross-origin resources without ``Timing-Allow-Origin``
+        header are ``0``.
+        """
+        return await self.evaluate(
+            '''() => performance.getEntriesByType('navigation')
+                .concat(performance.getEntriesByType('resource'))
+                .map(entry => ({
+                    url: entry.name,
+                    initiatorType: entry.initiatorType,
+                    startTime: entry.startTime,
+                    dns: entry.domainLookupEnd - entry.domainLookupStart,
+                    connect: entry.connectEnd - entry.connectStart,
+                    ttfb: entry.responseStart ? entry.responseStart - entry.requestStart : 0,
+                    download: entry.responseStart ? entry.responseEnd - entry.responseStart : 0,
+                    duration: entry.duration,
+                    transferSize: entry.transferSize,
+                }))'''
+        )
+
+    def startLoadWaterfall(self) -> None:
+        """Start recording finished requests for :meth:`loadWaterfall`.
+
+        Recording is off by default, so that pages which do not use
+        :meth:`loadWaterfall` do not pay for it.
+        """
+        self._networkManager.startLoadRecording()
+
+    def stopLoadWaterfall(self) -> None:
+        """Stop recording requests for :meth:`loadWaterfall`.
+
+        Records collected so far are dropped.
+        """
+        self._networkManager.stopLoadRecording()
+
+    def loadWaterfall(self) -> Dict[str, Any]:
+        """Get a waterfall summary of the requests of the current document.
+
+        Unlike :meth:`resourceTimings`, this is built in Python from the
+        network events of requests which finished or failed since the last
+        main frame navigation, including redirects, so it works for pages
+        which are not same-origin and needs no round trip to the page.
+        Requests are only recorded between :meth:`startLoadWaterfall` and
+        :meth:`stopLoadWaterfall`.
+
+        Returned dictionary has the following keys, all durations and times
+        are in milliseconds:
+
+        * ``resources`` (List[Dict]): One item per request in order of
+          completion, with ``url``, ``resourceType``, ``status``, ``failed``,
+          ``startTime`` (relative to the navigation), ``blocked``, ``dns``,
+          ``connect``, ``ssl``, ``ttfb``, ``download``, ``duration`` and
+          ``transferSize``. Phases which did not happen are ``-1``.
+        * ``transferSize`` (int): Total transferred bytes.
+        * ``criticalPath`` (List[str]): URLs of the chain of requests, each
+          initiated by the previous one, which ends last.
+        * ``criticalPathLength`` (float): Time from the navigation to the end
+          of the critical path.
+        """
+        navigationStart, records = self._networkManager.loadRecords()
+        resources = []
+        byURL: Dict[str, Dict] = {}
+        for record in records:
+            timings = harTimings(record['timing'], record['startTime'], record['endTime'], record['endTime'])
+            if record['timing']:
+                ttfb, download = round(timings['send'] + timings['wait'], 3), timings['receive']
+            else:
+                # cached, failed and data: requests have no resource timing
+                ttfb = download = -1
+            resource = {
+                'url': record['url'],
+                'resourceType': record['resourceType'],
+                'status': record['status'],
+                'failed': record['failed'],
+                'startTime': round((record['startTime'] - navigationStart) * 1000, 3),
+                'blocked': timings['blocked'],
+                'dns': timings['dns'],
+                'connect': timings['connect'],
+                'ssl': timings['ssl'],
+                'ttfb': ttfb,
+                'download': download,
+                'duration': round((record['endTime'] - record['startTime']) * 1000, 3),
+                'transferSize': record['transferSize'],
+            }
+            resources.append(resource)
+            byURL.setdefault(record['url'], record)
+
+        criticalPath: List[str] = []
+        criticalPathLength = 0.0
+        if records:
+            last = max(records, key=lambda record: record['endTime'])
+            criticalPathLength = round((last['endTime'] - navigationStart) * 1000, 3)
+            step: Optional[Dict] = last
+            while step is not None and step['url'] not in criticalPath:
+                criticalPath.insert(0, step['url'])
+                step = byURL.get(step['initiator'])
+        return {
+            'resources': resources,
+            'transferSize': sum(resource['transferSize'] for resource in resources),
+            'criticalPath': criticalPath,
+            'criticalPathLength': criticalPathLength,
+        }
+
     def setDefaultNavigationTimeout(self, timeout: int) -> None:
         """Change the default maximum navigation timeout.
 
@@ -321,6 +596,51 @@ class Page(EventEmitter):
         """
         self._defaultNavigationTimeout = timeout
 
+    def setConsoleOptions(self, options: dict = None, **kwargs: Any) -> None:
+        """Change how ``console`` events are dispatched.
+
+        Available options are:
+
+        * ``lazyArgs`` (bool): Build message text from the protocol event and
+          create :class:`~pyppeteer.execution_context.JSHandle` objects only
+          when :attr:`ConsoleMessage.args` is accessed. Arguments of a message
+          are released in the browser as soon as the message is garbage
+          collected without its ``args`` being accessed.
+        * ``sampleRate`` (float): Fraction of messages to dispatch, between
+          ``0`` and ``1``. Defaults to ``1``.
+        * ``maxPerSecond`` (int): Maximum number of messages dispatched per
+          second. ``0`` drops all messages. Defaults to no limit.
+
+        Messages dropped by sampling or rate limiting are released without
+        creating any handle. Calling this method replaces previous options.
+        """
+        options = merge_dict(options, kwargs)
+        sampleRate = options.get('sampleRate', 1)
+        if not 0 <= sampleRate <= 1:
+            raise PageError(f'sampleRate must be between 0 and 1, got {sampleRate}')
+        maxPerSecond = options.get('maxPerSecond')
+        if maxPerSecond is not None and maxPerSecond < 0:
+            raise PageError(f'maxPerSecond must not be negative, got {maxPerSecond}')
+        self._consoleOptions = options
+        self._consoleWindowCount = 0
+
+    def _acceptConsoleMessage(self) -> bool:
+        if not self.listeners(Page.Events.Console):
+            return False
+        sampleRate = self._consoleOptions.get('sampleRate', 1)
+        if sampleRate < 1 and random.random() >= sampleRate:
+            return False
+        maxPerSecond = self._consoleOptions.get('maxPerSecond')
+        if maxPerSecond is not None:
+            now = self._client._loop.time()
+            if now - self._consoleWindowStart >= 1:
+                self._consoleWindowStart = now
+                self._consoleWindowCount = 0
+            if self._consoleWindowCount >= maxPerSecond:
+                return False
+            self._consoleWindowCount += 1
+        return True
+
     async def _send(self, method: str, msg: dict) -> None:
         try:
             await self._client.send(method, msg)
@@ -364,6 +684,25 @@ class Page(EventEmitter):
             raise PageError('No context.')
         return await context.evaluateHandle(pageFunction, *args)
 
+    def handleScope(self) -> HandleScope:
+        """Return an async context manager which releases handles on exit.
+
+        All :class:`~pyppeteer.execution_context.JSHandle` and
+        :class:`~pyppeteer.element_handle.ElementHandle` objects created
+        inside the ``async with`` block (in the same task, or in tasks started
+        from it) belong to one V8 object group. They are all released with a
+        single ``Runtime.releaseObjectGroup`` call on exit, so they cannot be
+        used afterwards.
+
+        .. code::
+
+            async with page.handleScope():
+                for link in await page.querySelectorAll('a'):
+                    print(await page.evaluate('a => a.href', link))
+            # all link handles are released here
+        """
+        return HandleScope(self._client)
+
     async def queryObjects(self, prototypeHandle: JSHandle) -> JSHandle:
         """Iterate js heap and finds all the objects with the handle.
 
@@ -480,11 +819,14 @@ class Page(EventEmitter):
         * ``secure`` (bool)
         """
         pageURL = self.url
+        items = []
         for cookie in cookies:
             item = dict(**cookie)
             if not cookie.get('url') and pageURL.startswith('http'):
                 item['url'] = pageURL
-            await self._client.send('Network.deleteCookies', item)
+            items.append(item)
+        # The protocol deletes one cookie per call, so send them all at once.
+        await asyncio.gather(*(self._client.send('Network.deleteCookies', item) for item in items))
 
     async def setCookie(self, *cookies: dict) -> None:
         """Set cookies.
@@ -685,12 +1027,31 @@ function addPageBinding(bindingName) {
         self.emit(Page.Events.PageError, PageError(message))
 
     def _onConsoleAPI(self, event: dict) -> None:
+        remoteObjects = event.get('args', [])
+        if not self._acceptConsoleMessage():
+            for remoteObject in remoteObjects:
+                if remoteObject.get('objectId'):
+                    self._client._releaseObjectLater(remoteObject['objectId'])
+            return
+
         _id = event['executionContextId']
         context = self._frameManager.executionContextById(_id)
-        values: List[JSHandle] = []
-        for arg in event.get('args', []):
-            values.append(self._frameManager.createJSHandle(context, arg))
-        self._addConsoleMessage(event['type'], values)
+        if not self._consoleOptions.get('lazyArgs'):
+            values: List[JSHandle] = []
+            for arg in remoteObjects:
+                values.append(self._frameManager.createJSHandle(context, arg))
+            self._emitConsoleMessage(event['type'], values)
+            return
+
+        text = ' '.join(_consoleArgText(arg) for arg in remoteObjects)
+        message = ConsoleMessage(event['type'], text)
+        frameManager = self._frameManager
+        message._createArgs = lambda: [frameManager.createJSHandle(context, arg) for arg in remoteObjects]
+        objectIds = [arg['objectId'] for arg in remoteObjects if arg.get('objectId')]
+        if objectIds:
+            message._releaseArgs = weakref.finalize(message, _releaseConsoleArgs, self._client, objectIds)
+            message._releaseArgs.atexit = False
+        self.emit(Page.Events.Console, message)
 
     def _onBindingCalled(self, event: Dict) -> None:
         obj = json.loads(event['payload'])
@@ -713,20 +1074,15 @@ function addPageBinding(bindingName) {
             helper.debugError(logger, e)
 
     def _addConsoleMessage(self, type: str, args: List[JSHandle]) -> None:
-        if not self.listeners(Page.Events.Console):
+        if not self._acceptConsoleMessage():
             for arg in args:
-                self._client._loop.create_task(arg.dispose())
+                arg._disposeInBackground()
             return
+        self._emitConsoleMessage(type, args)
 
-        textTokens = []
-        for arg in args:
-            remoteObject = arg._remoteObject
-            if remoteObject.get('objectId'):
-                textTokens.append(arg.toString())
-            else:
-                textTokens.append(str(helper.valueFromRemoteObject(remoteObject)))
-
-        message = ConsoleMessage(type, ' '.join(textTokens), args)
+    def _emitConsoleMessage(self, type: str, args: List[JSHandle]) -> None:
+        text = ' '.join(_consoleArgText(arg._remoteObject) for arg in args)
+        message = ConsoleMessage(type, text, args)
         self.emit(Page.Events.Console, message)
 
     def _onDialog(self, event: Any) -> None:
@@ -782,7 +1138,7 @@ function addPageBinding(bindingName) {
         * ``timeout`` (int): Maximum navigation time in milliseconds, defaults
           to 30 seconds, pass ``0`` to disable timeout. The default value can
           be changed by using the :meth:`setDefaultNavigationTimeout` method.
-        * ``waitUntil`` (str|List[str]): When to consider navigation succeeded,
+        * ``waitUntil`` (str|dict|list): When to consider navigation succeeded,
           defaults to ``load``. Given a list of event strings, navigation is
           considered to be successful after all events have been fired. Events
           can be either:
@@ -793,6 +1149,21 @@ function addPageBinding(bindingName) {
             for at least 500 ms.
           * ``networkidle2``: when there are no more than 2 network connections
             for at least 500 ms.
+          * ``{'networkidle': {...}}``: when there are no more than
+            ``maxInflight`` requests in flight for at least ``idleTime``,
+            counted by pyppeteer instead of the browser. Available fields are:
+
+            * ``maxInflight`` (int): Defaults to 0.
+            * ``idleTime`` (int): Milliseconds, defaults to 500.
+            * ``ignore`` (List[str|Callable[[Request], bool]]): URL wildcard
+              patterns or predicates of requests which are not counted, e.g.
+              analytics beacons or long-polling requests.
+
+            .. code:: python
+
+                await page.goto(url, waitUntil=['load', {'networkidle': {
+                    'maxInflight': 1, 'ignore': ['*/collect?*'],
+                }}])
 
         The ``Page.goto`` will raise errors if:
 
@@ -825,17 +1196,15 @@ function addPageBinding(bindingName) {
         eventListeners = [helper.addEventListener(self._networkManager, NetworkManager.Events.Request, set_request,)]
 
         timeout = options.get('timeout', self._defaultNavigationTimeout)
-        watcher = NavigatorWatcher(self._frameManager, mainFrame, timeout, options)
-
-        result = await self._navigate(url, referrer)
-        if result is not None:
-            raise PageError(result)
-        result = await watcher.navigationPromise()
-        watcher.cancel()
-        helper.removeEventListeners(eventListeners)
-        error = result[0].pop().exception()  # type: ignore
-        if error:
-            raise error
+        watcher = NavigatorWatcher(self._frameManager, mainFrame, timeout, options, self._networkManager)
+        try:
+            result = await self._navigate(url, referrer)
+            if result is not None:
+                raise PageError(result)
+            await watcher.navigationPromise()
+        finally:
+            watcher.cancel()
+            helper.removeEventListeners(eventListeners)
 
         request = requests.get(mainFrame._navigationURL)
         return request.response if request else None
@@ -893,18 +1262,18 @@ function addPageBinding(bindingName) {
         if mainFrame is None:
             raise PageError('No main frame.')
         timeout = options.get('timeout', self._defaultNavigationTimeout)
-        watcher = NavigatorWatcher(self._frameManager, mainFrame, timeout, options)
+        watcher = NavigatorWatcher(self._frameManager, mainFrame, timeout, options, self._networkManager)
         responses: Dict[str, Response] = {}
         listener = helper.addEventListener(
             self._networkManager,
             NetworkManager.Events.Response,
             lambda response: responses.__setitem__(response.url, response),
         )
-        result = await watcher.navigationPromise()
-        helper.removeEventListeners([listener])
-        error = result[0].pop().exception()
-        if error:
-            raise error
+        try:
+            await watcher.navigationPromise()
+        finally:
+            watcher.cancel()
+            helper.removeEventListeners([listener])
 
         response = responses.get(self.url, None)
         return response
@@ -1116,7 +1485,7 @@ function addPageBinding(bindingName) {
             raise PageError('No main frame.')
         return await frame.evaluate(pageFunction, *args, force_expr=force_expr)
 
-    async def evaluateOnNewDocument(self, pageFunction: str, *args: str) -> None:
+    async def evaluateOnNewDocument(self, pageFunction: str, *args: Any) -> None:
         """Add a JavaScript function to the document.
 
         This function would be invoked in one of the following scenarios:
@@ -1507,6 +1876,50 @@ function addPageBinding(bindingName) {
             raise PageError('no main frame.')
         return await frame.select(selector, *values)
 
+    async def extract(self, selector: str, fields: Union[Dict[str, str], List[str]]) -> List[Dict[str, Any]]:
+        """Extract plain values from all elements matching ``selector``.
+
+        :arg str selector: A selector to query elements.
+        :arg fields: Mapping of result keys to element property names, like
+                     ``{'text': 'textContent', 'link': 'href'}``. Names
+                     starting with ``@`` read attributes instead, like
+                     ``'@data-id'``. A list of names uses each name as key.
+
+        Return a list of dicts, one per element in document order. All values
+        are read in a single evaluation and returned by value, so no handles
+        are created. Properties are read in pyppeteer's isolated world, so
+        page scripts cannot interfere, but also do not see expando properties
+        set by page scripts.
+
+        .. code::
+
+            links = await page.extract('a', {'text': 'textContent', 'url': 'href'})
+        """  # noqa: E501
+        frame = self.mainFrame
+        if not frame:
+            raise PageError('no main frame.')
+        return await frame.extract(selector, fields)
+
+    async def extractIter(
+        self, selector: str, fields: Union[Dict[str, str], List[str]], chunkSize: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Extract plain values from matching elements chunk by chunk.
+
+        Async generator variant of :meth:`extract` for huge result sets.
+        Matching elements are collected once, then their values are
+        transferred ``chunkSize`` elements per protocol message.
+
+        .. code::
+
+            async for row in page.extractIter('tr', {'id': '@data-id', 'text': 'innerText'}):
+                print(row)
+        """  # noqa: E501
+        frame = self.mainFrame
+        if not frame:
+            raise PageError('no main frame.')
+        async for item in frame.extractIter(selector, fields, chunkSize):
+            yield item
+
     async def type(self, selector: str, text: str, options: dict = None, **kwargs: Any) -> None:
         """Type ``text`` on the element which matches ``selector``.
 
@@ -1563,8 +1976,14 @@ function addPageBinding(bindingName) {
         ``timeout`` milliseconds of waiting, the function will raise error.
 
         :arg str selector: A selector of an element to wait for.
-        :return: Return awaitable object which resolves when element specified
-                 by selector string is added to DOM.
+        :return: Return :class:`asyncio.Task` which resolves to the
+                 ElementHandle when element specified by selector string is
+                 added to DOM. Cancel the task to stop waiting.
+
+        .. note::
+            This used to return a ``WaitTask``. The element is now found in an
+            isolated world and then adopted into the main world, so the
+            returned object is an :class:`asyncio.Task`.
 
         This method accepts the following options:
 
@@ -1592,8 +2011,12 @@ function addPageBinding(bindingName) {
 
 
         :arg str xpath: A [xpath] of an element to wait for.
-        :return: Return awaitable object which resolves when element specified
-                 by xpath string is added to DOM.
+        :return: Return :class:`asyncio.Task` which resolves to the
+                 ElementHandle when element specified by xpath string is added
+                 to DOM. Cancel the task to stop waiting.
+
+        .. note::
+            This used to return a ``WaitTask``, see :meth:`waitForSelector`.
 
         Available options are:
 
@@ -1686,6 +2109,20 @@ def convertPrintParameterToInches(parameter: Union[None, int, float, str]) -> Op
     return pixels / 96
 
 
+def _consoleArgText(remoteObject: Dict) -> str:
+    if remoteObject.get('objectId'):
+        _type = remoteObject.get('subtype') or remoteObject.get('type')
+        return f'JSHandle@{_type}'
+    return str(helper.valueFromRemoteObject(remoteObject))
+
+
+def _releaseConsoleArgs(client: CDPSession, objectIds: List[str]) -> None:
+    if not client._connection:
+        return
+    for objectId in objectIds:
+        client._releaseObjectLater(objectId)
+
+
 class ConsoleMessage(object):
     """Console message class.
 
@@ -1699,6 +2136,8 @@ class ConsoleMessage(object):
         self._text = text
         #: list of JSHandle
         self._args = args if args is not None else []
+        self._createArgs: Optional[Callable[[], List[JSHandle]]] = None
+        self._releaseArgs: Optional[weakref.finalize] = None
 
     @property
     def type(self) -> str:
@@ -1713,4 +2152,9 @@ class ConsoleMessage(object):
     @property
     def args(self) -> List[JSHandle]:
         """Return list of args (JSHandle) of this message."""
+        if self._createArgs is not None:
+            self._args = self._createArgs()
+            self._createArgs = None
+            if self._releaseArgs is not None:
+                self._releaseArgs.detach()
         return self._args
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Shared deadline scheduler module."""
+
+import asyncio
+import math
+from typing import Callable, Dict, Optional
+from weakref import WeakKeyDictionary
+
+#: Granularity of deadlines in seconds. Deadlines falling into the same slot
+#: share one loop timer.
+RESOLUTION = 0.01
+
+
+class Deadline(object):
+    """Callback scheduled by :class:`DeadlineScheduler`."""
+
+    __slots__ = ('_scheduler', '_slot', '_callback', 'when')
+
+    def __init__(self, scheduler: 'DeadlineScheduler', slot: int,
+                 callback: Callable[[], None], when: float) -> None:
+        self._scheduler = scheduler
+        self._slot = slot
+        self._callback: Optional[Callable[[], None]] = callback
+        self.when = when
+
+    def active(self) -> bool:
+        """Return ``True`` if this deadline has neither fired nor cancelled."""
+        return self._callback is not None
+
+    def cancel(self) -> None:
+        """Cancel this deadline. Do nothing if it is already done."""
+        if self._callback is None:
+            return
+        self._callback = None
+        self._scheduler._remove(self)
+
+
+class DeadlineScheduler(object):
+    """Timer wheel which runs many deadlines on few loop timers.
+
+    Deadlines are rounded up to :data:`RESOLUTION`, so they never fire early,
+    and all deadlines of a slot are run by one ``loop.call_at`` handle.
+    Scheduling and cancelling are O(1).
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Make new deadline scheduler."""
+        self._loop = loop
+        self._slots: Dict[int, Dict[Deadline, None]] = dict()
+        self._handles: Dict[int, asyncio.TimerHandle] = dict()
+
+    def __len__(self) -> int:
+        """Return number of pending deadlines."""
+        return sum(len(deadlines) for deadlines in self._slots.values())
+
+    def schedule(self, delay: float, callback: Callable[[], None]
+                 ) -> Deadline:
+        """Run ``callback`` after ``delay`` seconds."""
+        when = self._loop.time() + delay
+        slot = math.ceil(when / RESOLUTION)
+        deadline = Deadline(self, slot, callback, when)
+        deadlines = self._slots.get(slot)
+        if deadlines is None:
+            deadlines = self._slots[slot] = dict()
+            self._handles[slot] = self._loop.call_at(
+                slot * RESOLUTION, self._fire, slot)
+        deadlines[deadline] = None
+        return deadline
+
+    def _remove(self, deadline: Deadline) -> None:
+        deadlines = self._slots.get(deadline._slot)
+        if deadlines is None:
+            return
+        deadlines.pop(deadline, None)
+        if not deadlines:
+            del self._slots[deadline._slot]
+            self._handles.pop(deadline._slot).cancel()
+
+    def _fire(self, slot: int) -> None:
+        self._handles.pop(slot, None)
+        for deadline in self._slots.pop(slot, ()):
+            callback = deadline._callback
+            if callback is None:
+                continue
+            deadline._callback = None
+            try:
+                callback()
+            except Exception as e:
+                self._loop.call_exception_handler({
+                    'message': 'Exception in deadline callback',
+                    'exception': e,
+                })
+
+
+_schedulers: 'WeakKeyDictionary[asyncio.AbstractEventLoop, DeadlineScheduler]' = WeakKeyDictionary()  # noqa: E501
+
+
+def getScheduler(loop: asyncio.AbstractEventLoop) -> DeadlineScheduler:
+    """Get shared :class:`DeadlineScheduler` of the ``loop``."""
+    scheduler = _schedulers.get(loop)
+    if scheduler is None:
+        scheduler = _schedulers[loop] = DeadlineScheduler(loop)
+    return scheduler
+
+
+def scheduleDeadline(loop: asyncio.AbstractEventLoop, timeout: float,
+                     callback: Callable[[], None]) -> Deadline:
+    """Run ``callback`` after ``timeout`` milliseconds on shared scheduler."""
+    return getScheduler(loop).schedule(timeout / 1000, callback)
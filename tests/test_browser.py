@@ -189,3 +189,35 @@ class TestPageClose(BaseTestCase):
         self.assertFalse(newPage.isClosed())
         await newPage.close()
         self.assertTrue(newPage.isClosed())
+
+
+class TestCrawl(BaseTestCase):
+    @sync
+    async def test_crawl(self):
+        urls = [self.url + 'empty', self.url + 'static/one-style.html',
+                'http://localhost:1/']
+
+        async def handler(page, response):
+            return page.url
+
+        items = {}
+        async for item in self.browser.crawl(urls, handler, concurrency=2,
+                                             retries=1, recycleAfter=1):
+            items[item['url']] = item
+        self.assertEqual(set(items), set(urls))
+        for url in urls[:2]:
+            self.assertEqual(items[url]['status'], 200)
+            self.assertEqual(items[url]['result'], url)
+            self.assertIsNone(items[url]['error'])
+            self.assertEqual(items[url]['attempts'], 1)
+        self.assertIsNotNone(items[urls[2]]['error'])
+        self.assertEqual(items[urls[2]]['attempts'], 2)
+
+    @sync
+    async def test_crawl_closes_pages(self):
+        pages = len(await self.context.pages())
+        urls = (self.url + 'empty' for _ in range(5))
+        async for item in self.browser.crawl(urls, context=self.context,
+                                             concurrency=3):
+            self.assertEqual(item['status'], 200)
+        self.assertEqual(len(await self.context.pages()), pages)
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import asyncio
+from pathlib import Path
 import unittest
 
 from pyppeteer import connect
@@ -132,3 +133,83 @@ class TestBrowserContext(BrowserBaseTestCase):
         self.assertEqual(len(contexts), 2)
         await remoteBrowser.disconnect()
         await context.close()
+
+    @sync
+    async def test_cookie_snapshot(self):
+        context1 = await self.browser.createIncognitoBrowserContext()
+        context2 = await self.browser.createIncognitoBrowserContext()
+        await context1.setCookies(
+            {'name': 'a', 'value': '1', 'url': self.url},
+            {'name': 'b', 'value': '2', 'domain': 'example.com',
+             'expires': 4102444800},
+        )
+        cookies = await context1.cookies()
+        self.assertEqual(sorted(cookie['name'] for cookie in cookies),
+                         ['a', 'b'])
+        self.assertEqual(await context2.cookies(), [])
+
+        outfile = Path(__file__).parent / 'cookies.json'
+        try:
+            snapshot = await context1.snapshotCookies(str(outfile))
+            await context2.setCookies(
+                {'name': 'c', 'value': '3', 'url': self.url})
+            await context2.restoreCookies(str(outfile))
+        finally:
+            outfile.unlink()
+        restored = await context2.cookies()
+        self.assertEqual(
+            sorted((cookie['name'], cookie['value']) for cookie in restored),
+            [('a', '1'), ('b', '2')],
+        )
+        self.assertNotIn('size', snapshot[0])
+
+        page = await context2.newPage()
+        await page.goto(self.url + 'empty')
+        self.assertEqual(await page.evaluate('document.cookie'), 'a=1')
+
+        await context1.clearCookies()
+        self.assertEqual(await context1.cookies(), [])
+        await context1.close()
+        await context2.close()
+
+    @sync
+    async def test_storage_state(self):
+        context1 = await self.browser.createIncognitoBrowserContext()
+        page1 = await context1.newPage()
+        await page1.goto(self.url + 'empty')
+        await page1.evaluate('''() => {
+            localStorage.setItem('token', 'abc');
+            sessionStorage.setItem('tab', '1');
+            document.cookie = 'name=page1';
+        }''')
+        state = await context1.storageState()
+        origin = self.url.rstrip('/')
+        self.assertEqual(state['origins'], [{
+            'origin': origin,
+            'localStorage': [{'name': 'token', 'value': 'abc'}],
+            'sessionStorage': [{'name': 'tab', 'value': '1'}],
+        }])
+        self.assertEqual([cookie['name'] for cookie in state['cookies']],
+                         ['name'])
+        await context1.close()
+
+        context2 = await self.browser.createIncognitoBrowserContext()
+        await context2.restoreStorageState(state)
+        self.assertEqual(len(await context2.pages()), 0)
+        page2 = await context2.newPage()
+        await page2.goto(self.url + 'empty')
+        self.assertEqual(await page2.evaluate('''() => [
+            localStorage.getItem('token'),
+            sessionStorage.getItem('tab'),
+            document.cookie,
+        ]'''), ['abc', '1', 'name=page1'])
+
+        # restored once per tab: items removed by the page stay removed
+        await page2.evaluate('() => sessionStorage.removeItem("tab")')
+        await page2.reload()
+        self.assertIsNone(
+            await page2.evaluate('() => sessionStorage.getItem("tab")'))
+        self.assertEqual(
+            (await context2.storageState())['origins'][0]['sessionStorage'],
+            [])
+        await context2.close()
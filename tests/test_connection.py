@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import asyncio
+
 from syncer import sync
 
 from pyppeteer.errors import NetworkError
@@ -57,3 +59,17 @@ class TestCDPSession(BaseTestCase):
                 'Runtime.evaluate',
                 {'expression': '1 + 3', 'returnByValue': True}
             )
+
+    @sync
+    async def test_batched_release(self):
+        client = self.page._client
+        handles = [await self.page.evaluateHandle('() => ({})')
+                   for _ in range(3)]
+        for handle in handles:
+            handle._disposeInBackground()
+        self.assertEqual(len(client._pendingReleases), 3)
+        await asyncio.sleep(0)
+        self.assertEqual(client._pendingReleases, [])
+        with self.assertRaises(NetworkError):
+            await client.send('Runtime.getProperties', {
+                'objectId': handles[0]._remoteObject['objectId']})
@@ -374,6 +374,20 @@ class TestQuerySelector(BaseTestCase):
         elements = await html.JJ('div')
         self.assertEqual(len(elements), 0)
 
+    @sync
+    async def test_JJ_many(self):
+        await self.page.setContent('<div class="root"></div>')
+        await self.page.evaluate('''() => {
+            const root = document.querySelector('.root');
+            for (let i = 0; i < 1000; i++)
+                root.appendChild(document.createElement('span'));
+        }''')
+        root = await self.page.J('.root')
+        elements = await root.JJ('span')
+        self.assertEqual(len(elements), 1000)
+        self.assertEqual(
+            await self.page.evaluate('e => e.tagName', elements[-1]), 'SPAN')
+
     @sync
     async def test_JJEval(self):
         await self.page.setContent(
@@ -85,6 +85,26 @@ class TestJSHandle(BaseTestCase):
         self.assertTrue(foo)
         self.assertEqual(await foo.jsonValue(), 'bar')
 
+    @sync
+    async def test_get_property_primitive_and_promise(self):
+        handle = await self.page.evaluateHandle(
+            '() => ({foo: "bar", promise: Promise.resolve(1)})')
+        foo = await handle.getProperty('foo')
+        self.assertEqual(await foo.jsonValue(), 'bar')
+        promise = await handle.getProperty('promise')
+        self.assertEqual(promise._remoteObject.get('subtype'), 'promise')
+        string = await self.page.evaluateHandle('"abc"')
+        length = await string.getProperty('length')
+        self.assertEqual(await length.jsonValue(), 3)
+
+    @sync
+    async def test_get_properties_by_name(self):
+        handle = await self.page.evaluateHandle('() => document.body')
+        properties = await handle.getProperties(['tagName', 'missing'])
+        self.assertEqual(set(properties), {'tagName', 'missing'})
+        self.assertEqual(await properties['tagName'].jsonValue(), 'BODY')
+        self.assertIsNone(await properties['missing'].jsonValue())
+
     @sync
     async def test_return_non_own_properties(self):
         aHandle = await self.page.evaluateHandle('''() => {
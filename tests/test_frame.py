@@ -8,6 +8,7 @@ import unittest
 from syncer import sync
 
 from pyppeteer.errors import ElementHandleError, NetworkError, TimeoutError
+from pyppeteer.frame_manager import UTILITY_WORLD_NAME
 
 from .base import BaseTestCase
 from .frame_utils import attachFrame, detachFrame, dumpFrames, navigateFrame
@@ -157,6 +158,34 @@ class TestWaitForFunction(BaseTestCase):
         await fut
         self.assertTrue(result)
 
+    @sync
+    async def test_poll_on_mutation_shared_observer(self):
+        futs = [
+            asyncio.ensure_future(self.page.waitForSelector(f'.item{i}'))
+            for i in range(3)
+        ]
+        await asyncio.sleep(0.1)
+        await self.page.evaluate('''() => {
+            for (let i = 0; i < 3; i++) {
+                const div = document.createElement('div');
+                div.className = `item${i}`;
+                document.body.appendChild(div);
+            }
+        }''')
+        handles = await asyncio.gather(*futs)
+        for i, handle in enumerate(handles):
+            self.assertEqual(
+                await self.page.evaluate('e => e.className', handle),
+                f'item{i}',
+            )
+
+    @sync
+    async def test_predicate_helper_installed_once(self):
+        await self.page.waitForFunction('() => true')
+        await self.page.waitForFunction('() => 1 + 1', polling=10)
+        context = await self.page.mainFrame.executionContext()
+        self.assertEqual(len(context._cachedHandles), 1)
+
     @sync
     async def test_poll_on_raf(self):
         result = []
@@ -688,3 +717,79 @@ http://localhost:{port}/static/nested-frames.html
         self.assertEqual(frame1.parentFrame, None)
         self.assertEqual(frame2.parentFrame, frame1)
         self.assertEqual(frame3.parentFrame, frame1)
+
+    @sync
+    async def test_subtree_lifecycle(self):
+        await self.page.goto(self.url + 'static/nested-frames.html')
+        mainFrame = self.page.mainFrame
+        self.assertTrue(mainFrame._hasSubtreeLifecycle(['load']))
+        await attachFrame(self.page, 'frame1', self.url + 'empty')
+        frame = self.page.frames[-1]
+        frame._onLifecycleEvent('loader', 'init')
+        self.assertFalse(mainFrame._hasSubtreeLifecycle(['load']))
+        await detachFrame(self.page, 'frame1')
+        self.assertTrue(mainFrame._hasSubtreeLifecycle(['load']))
+
+    @sync
+    async def test_utility_world_helpers(self):
+        await self.page.setContent('<!DOCTYPE html><div class="a">x</div>')
+        await self.page.evaluate('''() => {
+            document.querySelector = () => null;
+            XMLSerializer.prototype.serializeToString = () => 'broken';
+        }''')
+        self.assertTrue((await self.page.content()).startswith(
+            '<!DOCTYPE html>'))
+        element = await self.page.waitForSelector('.a')
+        self.assertEqual(
+            await self.page.evaluate('e => e.textContent', element), 'x')
+
+    @sync
+    async def test_utility_world_fallback(self):
+        # without the isolated world, helpers run in the main world and
+        # survive navigations there
+        self.page._frameManager._isolatedWorlds.clear()
+        waitTask = self.page.waitForSelector('.a')
+        await self.page.goto(self.url + 'empty')
+        await self.page.setContent('<div class="a">x</div>')
+        element = await asyncio.wait_for(waitTask, 5)
+        self.assertEqual(
+            await self.page.evaluate('e => e.textContent', element), 'x')
+
+    @sync
+    async def test_utility_world_replaced(self):
+        # the new world may be reported before the old one is destroyed
+        await self.page.goto(self.url + 'empty')
+        frame = self.page.mainFrame
+        old = await frame._utilityContext()
+        await self.page._client.send('Page.createIsolatedWorld', {
+            'frameId': frame._id,
+            'worldName': UTILITY_WORLD_NAME,
+        })
+        self.page._frameManager._onExecutionContextDestroyed(old._contextId)
+        new = await asyncio.wait_for(frame._utilityContext(), 5)
+        self.assertIsNot(new, old)
+        await self.page.setContent('<div class="a">x</div>')
+        await asyncio.wait_for(self.page.waitForSelector('.a'), 5)
+
+    @sync
+    async def test_wait_for_selector_cancel(self):
+        waitTask = self.page.waitForSelector('.never')
+        await asyncio.sleep(0.01)
+        waitTask.cancel()
+        await asyncio.sleep(0.01)
+        self.assertEqual(len(self.page.mainFrame._waitTasks), 0)
+
+    @sync
+    async def test_document_handle_memo(self):
+        await self.page.goto(self.url + 'empty')
+        frame = self.page.mainFrame
+        documents = await asyncio.gather(
+            *[frame._document() for _ in range(5)])
+        self.assertTrue(all(d is documents[0] for d in documents))
+        await self.page.goto(self.url + 'static/one-style.html')
+        self.assertEqual(documents[0].executionContext._cachedHandles, {})
+        # a racing caller gets the retryable context error
+        with self.assertRaises(NetworkError):
+            await documents[0].executionContext.evaluate(
+                'd => d.title', documents[0])
+        self.assertIsNot(await frame._document(), documents[0])
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+from pathlib import Path
+
+from syncer import sync
+
+from pyppeteer.errors import PageError
+
+from .base import BaseTestCase
+
+
+class TestHarRecorder(BaseTestCase):
+    def setUp(self):
+        self.outfile = Path(__file__).parent / 'page.har'
+        if self.outfile.is_file():
+            self.outfile.unlink()
+        super().setUp()
+
+    def tearDown(self):
+        if self.outfile.is_file():
+            self.outfile.unlink()
+        super().tearDown()
+
+    @sync
+    async def test_har(self):
+        await self.page.har.start({'path': str(self.outfile)})
+        await self.page.goto(self.url + 'static/one-style.html')
+        await self.page.har.stop()
+        log = json.loads(self.outfile.read_text())['log']
+        self.assertEqual(len(log['pages']), 1)
+        self.assertEqual(log['pages'][0]['title'],
+                         self.url + 'static/one-style.html')
+        urls = sorted(entry['request']['url'] for entry in log['entries'])
+        self.assertEqual(urls, [
+            self.url + 'static/one-style.css',
+            self.url + 'static/one-style.html',
+        ])
+        for entry in log['entries']:
+            self.assertEqual(entry['pageref'], log['pages'][0]['id'])
+            self.assertEqual(entry['response']['status'], 200)
+            self.assertNotIn('text', entry['response']['content'])
+
+    @sync
+    async def test_har_embed_content(self):
+        await self.page.har.start(path=str(self.outfile), content='embed',
+                                  contentFilter=['*.json'])
+        await self.page.goto(self.url + 'static/simple.json')
+        await self.page.goto(self.url + 'static/one-style.html')
+        await self.page.har.stop()
+        entries = json.loads(self.outfile.read_text())['log']['entries']
+        contents = {entry['request']['url']: entry['response']['content']
+                    for entry in entries}
+        self.assertEqual(contents[self.url + 'static/simple.json']['text'],
+                         '{"foo": "bar"}\n')
+        self.assertNotIn('text',
+                         contents[self.url + 'static/one-style.css'])
+
+    @sync
+    async def test_har_not_started(self):
+        with self.assertRaises(PageError):
+            await self.page.har.stop()
+
+    @sync
+    async def test_har_page_closed(self):
+        page = await self.context.newPage()
+        await page.har.start(path=str(self.outfile))
+        await page.goto(self.url + 'static/one-style.html')
+        await page.close()
+        log = json.loads(self.outfile.read_text())['log']
+        self.assertEqual(len(log['pages']), 1)
+        with self.assertRaises(PageError):
+            await page.har.stop()
+
+
+class TestReplayArchive(BaseTestCase):
+    def setUp(self):
+        self.outfile = Path(__file__).parent / 'replay.har'
+        super().setUp()
+
+    def tearDown(self):
+        if self.outfile.is_file():
+            self.outfile.unlink()
+        super().tearDown()
+
+    def writeArchive(self, url, body):
+        entry = {
+            'request': {'method': 'GET', 'url': url, 'headers': []},
+            'response': {
+                'status': 200,
+                'statusText': 'OK',
+                'headers': [{'name': 'Content-Type', 'value': 'text/html'}],
+                'content': {'mimeType': 'text/html', 'text': body},
+            },
+        }
+        self.outfile.write_text(json.dumps({'log': {'entries': [entry]}}))
+
+    @sync
+    async def test_replay(self):
+        self.writeArchive(self.url + 'replayed', '<div>replayed</div>')
+        archive = await self.page.setReplayArchive(str(self.outfile))
+        response = await self.page.goto(self.url + 'replayed')
+        self.assertEqual(response.status, 200)
+        self.assertEqual(
+            await self.page.evaluate('document.body.textContent'),
+            'replayed',
+        )
+        self.assertEqual(archive.hits, 1)
+        self.assertEqual(archive.misses, [])
+
+    @sync
+    async def test_replay_miss(self):
+        self.writeArchive(self.url + 'replayed', '')
+        archive = await self.page.setReplayArchive(str(self.outfile))
+        with self.assertRaises(PageError):
+            await self.page.goto(self.url + 'empty')
+        self.assertEqual(archive.misses,
+                         [{'method': 'GET', 'url': self.url + 'empty'}])
+
+        await self.page.setReplayArchive(archive, fallthrough='continue')
+        response = await self.page.goto(self.url + 'empty')
+        self.assertEqual(response.status, 200)
+        self.assertEqual(len(archive.misses), 2)
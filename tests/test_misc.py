@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import asyncio
 import logging
 import unittest
 
 import pyppeteer
+from pyppeteer.expiring_map import ExpiringMap
 from pyppeteer.helper import debugError, get_positive_int
 from pyppeteer.page import convertPrintParameterToInches
+from pyppeteer.timers import DeadlineScheduler
 
 
 class TestVersion(unittest.TestCase):
@@ -97,3 +100,76 @@ class TestDebugError(unittest.TestCase):
         with self.assertRaises(AssertionError):
             with self.assertLogs('pyppeteer', logging.DEBUG):
                 debugError(logging.getLogger('test'), 'test message')
+
+
+class TestExpiringMap(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.map = ExpiringMap(timer=lambda: self.now)
+
+    def test_evict_by_size(self):
+        self.map.maxSize = 2
+        self.assertEqual(self.map.set('a', 1), [])
+        self.assertEqual(self.map.set('b', 2), [])
+        self.assertEqual(self.map.set('c', 3), [1])
+        # re-inserting moves an entry to the end
+        self.assertEqual(self.map.set('b', 4), [])
+        self.assertEqual(self.map.set('d', 5), [3])
+        self.assertEqual(self.map.values(), [4, 5])
+        self.assertEqual(self.map.evictedBySize, 2)
+        self.assertEqual(self.map.evictedByAge, 0)
+
+    def test_evict_by_age(self):
+        self.map.maxAge = 10
+        self.map.set('a', 1)
+        self.now = 5
+        self.map.set('b', 2)
+        self.now = 12
+        self.assertEqual(self.map.evict(), [1])
+        self.assertFalse(self.map.has('a'))
+        self.assertEqual(self.map.get('b'), 2)
+        self.now = 20
+        self.assertEqual(self.map.set('c', 3), [2])
+        self.assertEqual(self.map.size(), 1)
+        self.assertEqual(self.map.evictedByAge, 2)
+        self.assertEqual(self.map.evictedBySize, 0)
+
+    def test_no_limits(self):
+        for i in range(100):
+            self.map.set(i, i)
+        self.now = 1e9
+        self.assertEqual(self.map.evict(), [])
+        self.assertEqual(self.map.size(), 100)
+
+
+class TestDeadlineScheduler(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.scheduler = DeadlineScheduler(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_fire_and_cancel(self):
+        fired = []
+        start = self.loop.time()
+        deadlines = [
+            self.scheduler.schedule(0.05, lambda i=i: fired.append(i))
+            for i in range(100)
+        ]
+        self.assertEqual(len(self.scheduler), 100)
+        self.assertLessEqual(len(self.scheduler._handles), 2)
+        for deadline in deadlines[::2]:
+            deadline.cancel()
+        self.loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertEqual(fired, list(range(1, 100, 2)))
+        self.assertGreaterEqual(self.loop.time() - start, 0.05)
+        self.assertFalse(any(deadline.active() for deadline in deadlines))
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_cancel_all_releases_timer(self):
+        deadline = self.scheduler.schedule(10, lambda: None)
+        self.assertEqual(len(self.scheduler._handles), 1)
+        deadline.cancel()
+        deadline.cancel()
+        self.assertEqual(len(self.scheduler._handles), 0)
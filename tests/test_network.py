@@ -132,6 +132,126 @@ class TestNetworkEvent(BaseTestCase):
         self.assertEqual(await res.text(), '{"foo": "bar"}\n')
         self.assertEqual(await res.json(), {'foo': 'bar'})
 
+    @sync
+    async def test_response_body_memoized(self):
+        response = await self.page.goto(self.url + 'static/simple.json')
+        self.assertIs(response.buffer(), response.buffer())
+        self.assertEqual(await response.text(), '{"foo": "bar"}\n')
+        self.assertEqual(await response.json(), {'foo': 'bar'})
+        promise = response.buffer()
+        response.release()
+        self.assertIsNot(response.buffer(), promise)
+        self.assertEqual(await response.json(), {'foo': 'bar'})
+
+    @sync
+    async def test_response_body_capture(self):
+        self.page.setResponseBodyCapture(['*/simple.json'])
+        finished = []
+        self.page.on('requestfinished', lambda req: finished.append(req))
+        response = await self.page.goto(self.url + 'static/simple.json')
+        await self.page.goto(self.url + 'empty')
+        self.assertEqual(await response.json(), {'foo': 'bar'})
+        self.assertEqual(len(finished), 2)
+        self.assertIsNone(finished[1].response._contentPromise)
+
+    @sync
+    async def test_response_buffer_retry(self):
+        response = await self.page.goto(self.url + 'static/simple.json')
+        client = response._client
+        calls = []
+
+        def send(method, params=None):
+            if method == 'Network.getResponseBody':
+                calls.append(method)
+                if len(calls) == 1:
+                    raise NetworkError('transient failure')
+            return client.send(method, params)
+
+        response._client = type('FlakyClient', (), {
+            '_loop': client._loop, 'send': staticmethod(send)})()
+        with self.assertRaises(NetworkError):
+            await response.text()
+        self.assertEqual(await response.json(), {'foo': 'bar'})
+        self.assertEqual(len(calls), 2)
+
+    @sync
+    async def test_response_iter_body(self):
+        response = await self.page.goto(self.url + 'static/simple.json')
+        chunks = [chunk async for chunk in response.iterBody(chunkSize=4)]
+        self.assertEqual(chunks[0], b'{"fo')
+        self.assertEqual(b''.join(chunks), b'{"foo": "bar"}\n')
+        self.assertIsNone(response._contentPromise)
+
+    @sync
+    async def test_response_stream_intercepted(self):
+        await self.page.goto(self.url + 'empty')
+        await self.page.setRequestInterception(True)
+        imagePath = Path(__file__).parent / 'static' / 'huge-image.png'
+        savePath = Path(__file__).parent / 'huge-image-stream.png'
+        saved = asyncio.get_event_loop().create_future()
+
+        async def save(res):
+            saved.set_result(await res.save(str(savePath), 64 * 1024))
+
+        self.page.on('request', lambda req: asyncio.ensure_future(
+            req.continue_({'interceptResponse': True})))
+        self.page.on('response', lambda res: asyncio.ensure_future(save(res)))
+        await self.page.evaluate(
+            '() => fetch("/static/huge-image.png").catch(e => null)')
+        try:
+            self.assertEqual(await saved, imagePath.stat().st_size)
+            self.assertEqual(savePath.read_bytes(), imagePath.read_bytes())
+        finally:
+            savePath.unlink()
+
+    @sync
+    async def test_response_timing(self):
+        response = await self.page.goto(self.url + 'static/simple.json')
+        self.assertTrue(response.timing)
+        self.assertGreater(response.timing['requestTime'], 0)
+        self.assertGreater(response.transferSize, len('{"foo": "bar"}\n'))
+
+    @sync
+    async def test_load_waterfall(self):
+        await self.page.goto(self.url + 'empty')
+        self.assertEqual(self.page.loadWaterfall()['resources'], [])
+        self.page.startLoadWaterfall()
+        await self.page.goto(self.url + 'static/one-style.html')
+        waterfall = self.page.loadWaterfall()
+        urls = [resource['url'] for resource in waterfall['resources']]
+        self.assertEqual(sorted(urls), [
+            self.url + 'static/one-style.css',
+            self.url + 'static/one-style.html',
+        ])
+        self.assertEqual(waterfall['criticalPath'], [
+            self.url + 'static/one-style.html',
+            self.url + 'static/one-style.css',
+        ])
+        self.assertGreater(waterfall['criticalPathLength'], 0)
+        self.assertEqual(
+            waterfall['transferSize'],
+            sum(resource['transferSize']
+                for resource in waterfall['resources']),
+        )
+        self.page.stopLoadWaterfall()
+        self.assertEqual(self.page.loadWaterfall()['resources'], [])
+
+    @sync
+    async def test_request_tracking_limits(self):
+        await self.page.goto(self.url + 'empty')
+        evicted = []
+        self.page._networkManager.on('requestevicted', evicted.append)
+        self.page.setRequestTrackingLimits(maxRequests=1)
+        # /long answers after 100ms, so all three requests are in flight
+        await self.page.evaluate('''() => Promise.all(
+            [0, 1, 2].map(i => fetch("/long?" + i)))''')
+        stats = self.page.requestTrackingStats()
+        self.assertLessEqual(stats['requests'], 1)
+        self.assertGreaterEqual(stats['evictedBySize'], 2)
+        self.assertEqual(stats['evictedByAge'], 0)
+        self.assertGreaterEqual(len(evicted), 2)
+        self.assertTrue(all('/long?' in request.url for request in evicted))
+
     @sync
     async def test_fail_get_redirected_body(self):
         response = await self.page.goto(self.url + 'redirect1')
@@ -461,6 +581,7 @@ class TestRequestInterception(BaseTestCase):
 
     @sync
     async def test_request_interception_abort_data_url(self):
+        # data URLs are never paused by the Fetch domain
         await self.page.setRequestInterception(True)
 
         async def request_check(req):
@@ -468,9 +589,34 @@ class TestRequestInterception(BaseTestCase):
 
         self.page.on('request',
                      lambda req: asyncio.ensure_future(request_check(req)))
-        with self.assertRaises(PageError) as cm:
-            await self.page.goto('data:text/html,No way!')
-        self.assertIn('net::ERR_FAILED', cm.exception.args[0])
+        response = await self.page.goto('data:text/html,No way!')
+        self.assertEqual(response.status, 200)
+
+    @sync
+    async def test_request_interception_override_post_data(self):
+        await self.page.goto(self.url + 'empty')
+
+        from tornado.web import RequestHandler
+
+        bodies = []
+
+        class PostHandler(RequestHandler):
+            def post(self):
+                bodies.append(self.request.body)
+                self.write(self.request.headers.get('foo', ''))
+
+        self.app.add_handlers('localhost', [('/post', PostHandler)])
+        await self.page.setRequestInterception(True)
+
+        async def check(req):
+            headers = dict(req.headers, foo='bar')
+            await req.continue_({'postData': b'doggo', 'headers': headers})
+
+        self.page.on('request', lambda req: asyncio.ensure_future(check(req)))
+        text = await self.page.evaluate(
+            '() => fetch("/post", {method: "POST", body: "birdy"}).then(r => r.text())')  # noqa: E501
+        self.assertEqual(bodies, [b'doggo'])
+        self.assertEqual(text, 'bar')
 
     @sync
     async def test_request_interception_with_hash(self):
@@ -573,10 +719,45 @@ class TestRequestInterception(BaseTestCase):
         body = await self.page.evaluate('() => document.body.textContent')
         self.assertEqual(body, 'intercepted')
 
-    @unittest.skip('Sending binary object is not implemented')
     @sync
     async def test_request_respond_bytes(self):
-        pass
+        await self.page.goto(self.url + 'empty')
+        await self.page.setRequestInterception(True)
+        imagePath = Path(__file__).parent / 'blank_800x600.png'
+        imageBody = imagePath.read_bytes()
+
+        async def interception(req):
+            await req.respond({
+                'contentType': 'image/png',
+                'body': memoryview(imageBody),
+            })
+
+        self.page.on(
+            'request', lambda req: asyncio.ensure_future(interception(req)))
+        width = await self.page.evaluate('''() => new Promise(resolve => {
+            const img = new Image();
+            img.onload = () => resolve(img.naturalWidth);
+            img.src = '/does-not-exist.png';
+        })''')
+        self.assertEqual(width, 800)
+
+    @sync
+    async def test_request_respond_path(self):
+        await self.page.setRequestInterception(True)
+        filePath = Path(__file__).parent / 'static' / 'one-frame.html'
+
+        async def interception(req):
+            await req.respond({'path': str(filePath)})
+
+        self.page.on(
+            'request', lambda req: asyncio.ensure_future(interception(req)))
+        response = await self.page.goto(self.url + 'empty')
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.headers['content-type'], 'text/html')
+        self.assertEqual(
+            int(response.headers['content-length']),
+            filePath.stat().st_size,
+        )
 
 
 class TestNavigationRequest(BaseTestCase):
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import asyncio
+import gc
 import math
 import os
 from pathlib import Path
@@ -263,6 +264,30 @@ class TestOfflineMode(BaseTestCase):
         self.assertTrue(await self.page.evaluate('window.navigator.onLine'))
 
 
+class TestNetworkConditions(BaseTestCase):
+    @sync
+    async def test_emulate_network_conditions(self):
+        await self.page.emulateNetworkConditions({'latency': 300})
+        await self.page.goto(self.url + 'static/one-style.html')
+        timings = await self.page.resourceTimings()
+        self.assertEqual(
+            [timing['url'] for timing in timings],
+            [self.url + 'static/one-style.html', self.url + 'static/one-style.css'],
+        )
+        self.assertEqual(timings[0]['initiatorType'], 'navigation')
+        for timing in timings:
+            self.assertGreaterEqual(timing['duration'], 250)
+        await self.page.emulateNetworkConditions(None)
+        await self.page.setOfflineMode(True)
+        self.assertFalse(await self.page.evaluate('window.navigator.onLine'))
+
+    @sync
+    async def test_unknown_preset(self):
+        await self.page.emulateNetworkConditions('Fast 3G')
+        with self.assertRaises(PageError):
+            await self.page.emulateNetworkConditions('Dial-up')
+
+
 class TestEvaluateHandle(BaseTestCase):
     @sync
     async def test_evaluate_handle(self):
@@ -361,6 +386,57 @@ console.log(Promise.resolve('should not wait until resolved!'));
             'JSHandle@promise',
         ])
 
+    @sync
+    async def test_console_lazy_args(self):
+        self.page.setConsoleOptions(lazyArgs=True)
+        messages = []
+        self.page.on('console', lambda m: messages.append(m))
+        await self.page.evaluate('() => console.log("hello", 5, {foo: "bar"})')
+        await asyncio.sleep(0.01)
+        self.assertEqual(len(messages), 1)
+        msg = messages[0]
+        self.assertEqual(msg.text, 'hello 5 JSHandle@object')
+        self.assertEqual(await msg.args[2].jsonValue(), {'foo': 'bar'})
+        self.assertIs(msg.args, msg.args)
+
+    @sync
+    async def test_console_lazy_args_released(self):
+        self.page.setConsoleOptions(lazyArgs=True)
+        events = []
+        self.page._client.on('Runtime.consoleAPICalled', events.append)
+        messages = []
+        self.page.on('console', lambda m: messages.append(m))
+        await self.page.evaluate('() => console.log({foo: "bar"})')
+        await asyncio.sleep(0.01)
+        self.assertEqual(len(messages), 1)
+        objectId = events[0]['args'][0]['objectId']
+        messages.clear()
+        gc.collect()
+        await asyncio.sleep(0.01)
+        with self.assertRaises(NetworkError):
+            await self.page._client.send('Runtime.callFunctionOn', {
+                'functionDeclaration': 'function() { return this; }',
+                'objectId': objectId,
+            })
+
+    @sync
+    async def test_console_rate_limit(self):
+        self.page.setConsoleOptions(maxPerSecond=2)
+        messages = []
+        self.page.on('console', lambda m: messages.append(m))
+        await self.page.evaluate('() => { for (let i = 0; i < 5; i++) console.log(i) }')
+        await asyncio.sleep(0.01)
+        self.assertEqual([msg.text for msg in messages], ['0', '1'])
+
+        self.page.setConsoleOptions(sampleRate=0)
+        await self.page.evaluate('() => console.log({})')
+        await asyncio.sleep(0.01)
+        self.assertEqual(len(messages), 2)
+        with self.assertRaises(PageError):
+            self.page.setConsoleOptions(sampleRate=2)
+        with self.assertRaises(PageError):
+            self.page.setConsoleOptions(maxPerSecond=-1)
+
     @sync
     async def test_console_window(self):
         messages = []
@@ -505,6 +581,35 @@ class TestGoto(BaseTestCase):
                                         waitUntil='networkidle2')
         self.assertEqual(response.status, 200)
 
+    @sync
+    async def test_nav_custom_networkidle(self):
+        # requests to /poll never finish
+        await self.page.setRequestInterception(True)
+        self.page.on(
+            'request',
+            lambda req: None if req.url.endswith('/poll') else asyncio.ensure_future(req.continue_()),
+        )
+        await self.page.evaluateOnNewDocument('() => fetch("/poll")')
+        with self.assertRaises(TimeoutError):
+            await self.page.goto(self.url + 'empty', waitUntil={'networkidle': {'idleTime': 100}}, timeout=1000)
+        response = await self.page.goto(
+            self.url + 'empty', waitUntil=['load', {'networkidle': {'idleTime': 100, 'ignore': ['*/poll']}}],
+        )
+        self.assertEqual(response.status, 200)
+
+    @sync
+    async def test_nav_custom_networkidle_evicted(self):
+        # the pending /poll request is dropped once the next one is tracked
+        await self.page.setRequestInterception(True)
+        self.page.on(
+            'request',
+            lambda req: None if req.url.endswith('/poll') else asyncio.ensure_future(req.continue_()),
+        )
+        self.page.setRequestTrackingLimits(maxRequests=1)
+        await self.page.evaluateOnNewDocument('() => { fetch("/poll"); setTimeout(() => fetch("/empty"), 50) }')
+        response = await self.page.goto(self.url + 'empty', waitUntil={'networkidle': {'idleTime': 100}}, timeout=2000)
+        self.assertEqual(response.status, 200)
+
     @sync
     async def test_goto_bad_url(self):
         with self.assertRaises(NetworkError):
@@ -1528,6 +1633,84 @@ class TestTitle(BaseTestCase):
         self.assertEqual(await self.page.title(), 'Button test')
 
 
+class TestHandleScope(BaseTestCase):
+    @sync
+    async def test_handle_scope(self):
+        await self.page.setContent('<div></div><div></div>')
+        async with self.page.handleScope():
+            elements = await self.page.JJ('div')
+            obj = await self.page.evaluateHandle('() => ({a: 1})')
+            self.assertEqual(await obj.jsonValue(), {'a': 1})
+        self.assertTrue(all(h._disposed for h in elements + [obj]))
+        obj._disposed = False
+        with self.assertRaises(NetworkError):
+            await obj.jsonValue()
+        self.assertEqual(len(await self.page.JJ('div')), 2)
+
+    @sync
+    async def test_handle_scope_nested(self):
+        async with self.page.handleScope():
+            outer = await self.page.evaluateHandle('() => ({})')
+            async with self.page.handleScope():
+                inner = await self.page.evaluateHandle('() => ({})')
+            self.assertTrue(inner._disposed)
+            self.assertFalse(outer._disposed)
+        self.assertTrue(outer._disposed)
+
+    @sync
+    async def test_handle_scope_foreign_handles(self):
+        # remote objects outside the scope's group are left alone
+        before = await self.page.evaluateHandle('() => ({a: {b: 1}})')
+        async with self.page.handleScope():
+            properties = await before.getProperties()
+        self.assertFalse(properties['a']._disposed)
+        self.assertEqual(await properties['a'].jsonValue(), {'b': 1})
+
+    @sync
+    async def test_handle_scope_outliving_task(self):
+        # tasks inherit the scope, but must not use it after it exited
+        started = asyncio.Event()
+
+        async def create():
+            await started.wait()
+            return await self.page.evaluateHandle('() => ({a: 1})')
+
+        async with self.page.handleScope() as scope:
+            task = asyncio.ensure_future(create())
+        started.set()
+        obj = await task
+        self.assertFalse(obj._disposed)
+        self.assertEqual(await obj.jsonValue(), {'a': 1})
+        self.assertEqual(scope._handles, [])
+
+
+class TestExtract(BaseTestCase):
+    @sync
+    async def test_extract(self):
+        await self.page.setContent(
+            '<a href="/one" data-id="1">One</a><a data-id="2">Two</a>')
+        result = await self.page.extract(
+            'a', {'text': 'textContent', 'id': '@data-id'})
+        self.assertEqual(result, [
+            {'text': 'One', 'id': '1'},
+            {'text': 'Two', 'id': '2'},
+        ])
+        self.assertEqual(await self.page.extract('span', ['id']), [])
+
+    @sync
+    async def test_extract_iter(self):
+        await self.page.evaluate('''() => {
+            for (let i = 0; i < 25; i++) {
+                const div = document.createElement('div');
+                div.id = `item${i}`;
+                document.body.appendChild(div);
+            }
+        }''')
+        items = [item async for item in self.page.extractIter(
+            'div', ['id'], chunkSize=10)]
+        self.assertEqual(items, [{'id': f'item{i}'} for i in range(25)])
+
+
 class TestSelect(BaseTestCase):
     def setUp(self):
         super().setUp()